@@ -3,14 +3,46 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from podflow import __version__
-from podflow.config import load_config
-from podflow.utils.logging import console, setup_logging
+
+if TYPE_CHECKING:
+    from podflow.config import PodflowConfig
+
+# Heavy dependencies (yaml, pydantic, rich, ...) are imported inside the
+# command callbacks so that `podflow --help` and friends stay fast.
+
+
+def _resolve_existing(
+    ctx: click.Context, param: click.Parameter, value: str | tuple[str, ...] | None,
+) -> Path | tuple[Path, ...] | None:
+    """Check that path argument(s) exist and make them absolute.
+
+    Symlinks are kept as given: episode IDs and default titles use the
+    name the user passed, not the link target's.
+    """
+    if value is None:
+        return None
+    if isinstance(value, tuple):
+        return tuple(_resolve_existing(ctx, param, v) for v in value)
+    try:
+        os.stat(value)
+    except OSError:
+        raise click.BadParameter(f"Path '{value}' does not exist.", ctx=ctx, param=param)
+    return Path(os.path.abspath(value))
+
+
+def _without_metadata_cache(config: PodflowConfig) -> PodflowConfig:
+    # Loaded configs are shared, so derive a copy rather than mutating
+    return config.model_copy(
+        update={"metadata": config.metadata.model_copy(update={"cache_enabled": False})}
+    )
 
 
 @click.group()
@@ -25,6 +57,8 @@ from podflow.utils.logging import console, setup_logging
 @click.pass_context
 def cli(ctx: click.Context, verbose: bool, config_path: str | None) -> None:
     """PodFlow — Podcast Automation Pipeline."""
+    from podflow.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
@@ -40,7 +74,8 @@ def cli(ctx: click.Context, verbose: bool, config_path: str | None) -> None:
 )
 def init(output_path: str) -> None:
     """Generate a starter podcast_config.yaml."""
-    from podflow.config import PodflowConfig
+    from podflow.config import PodflowConfig, load_config
+    from podflow.utils.logging import console
 
     out = Path(output_path)
     if out.exists():
@@ -49,19 +84,32 @@ def init(output_path: str) -> None:
 
     import yaml
 
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+
     config = PodflowConfig()
     data = config.model_dump()
     out.write_text(
-        yaml.dump(data, default_flow_style=False, sort_keys=False),
+        yaml.dump(data, Dumper=Dumper, default_flow_style=False, sort_keys=False),
         encoding="utf-8",
     )
+    # A lookup before this may have memoized "no config file here"
+    load_config.cache_clear()
     console.print(f"[green]Config written to {out}[/green]")
     console.print("Edit this file with your podcast details, then run:")
-    console.print("  podflow run <input_file>")
+    console.print("  podflow run <input_file> [<input_file> ...]")
 
 
 @cli.command()
-@click.argument("input_file", type=click.Path(exists=True))
+@click.argument(
+    "input_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(),
+    callback=_resolve_existing,
+)
 @click.option("--resume", is_flag=True, help="Resume from last failed stage")
 @click.option("--dry-run", is_flag=True, help="Show the plan without executing")
 @click.option("--episode-number", "-n", type=int, default=None, help="Episode number")
@@ -71,22 +119,66 @@ def init(output_path: str) -> None:
     default=None,
     help="YouTube privacy status",
 )
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    default=2,
+    show_default=True,
+    help="Episodes to process concurrently when given several input files",
+)
+@click.option("--no-cache", is_flag=True, help="Always call the LLM, ignoring cached metadata")
 @click.pass_context
 def run(
     ctx: click.Context,
-    input_file: str,
+    input_files: tuple[Path, ...],
     resume: bool,
     dry_run: bool,
     episode_number: int | None,
     privacy: str | None,
+    jobs: int,
+    no_cache: bool,
 ) -> None:
-    """Run the full podcast pipeline on an input file."""
-    from podflow.pipeline import run_pipeline
+    """Run the full podcast pipeline on one or more input files."""
+    from podflow.config import load_config
+    from podflow.pipeline import run_pipeline, run_pipeline_batch
+    from podflow.utils.logging import console
 
     config = load_config(ctx.obj["config_path"])
+    if no_cache:
+        config = _without_metadata_cache(config)
+
+    if len(input_files) > 1:
+        if episode_number is not None:
+            raise click.BadParameter(
+                "cannot be used with multiple input files", param_hint="'--episode-number'",
+            )
+        results = run_pipeline_batch(
+            input_paths=list(input_files),
+            config=config,
+            max_concurrency=jobs,
+            resume=resume,
+            dry_run=dry_run,
+            privacy=privacy,
+        )
+        failed = 0
+        for input_file, result in zip(input_files, results):
+            if isinstance(result, Exception):
+                failed += 1
+                console.print(f"[red bold]Failed:[/red bold] {input_file.name}: {result}")
+            elif not dry_run:
+                console.print(f"[green]Done:[/green] {input_file.name}")
+                if result.audio_url:
+                    console.print(f"  Audio URL: {result.audio_url}")
+                if result.youtube_url:
+                    console.print(f"  YouTube:   {result.youtube_url}")
+        if failed:
+            console.print("Run with --resume to retry from the failed stages.")
+            sys.exit(1)
+        return
+
     try:
         episode = run_pipeline(
-            input_path=Path(input_file),
+            input_path=input_files[0],
             config=config,
             resume=resume,
             dry_run=dry_run,
@@ -106,27 +198,28 @@ def run(
 
 
 @cli.command()
-@click.argument("input_file", type=click.Path(exists=True))
+@click.argument("input_file", type=click.Path(), callback=_resolve_existing)
 @click.pass_context
-def process(ctx: click.Context, input_file: str) -> None:
+def process(ctx: click.Context, input_file: Path) -> None:
     """Process audio (and video if present) only."""
+    from podflow.config import load_config
     from podflow.processing.audio import process_audio
     from podflow.processing.video import process_video
+    from podflow.utils.logging import console
     from podflow.utils.paths import (
         episode_id_from_file,
         episode_output_dir,
-        output_audio_path,
-        output_video_path,
+        episode_path,
     )
 
     config = load_config(ctx.obj["config_path"])
-    input_path = Path(input_file).resolve()
+    input_path = input_file
     base_output = Path(config.output.base_dir)
     episode_id = episode_id_from_file(input_path)
     ep_dir = episode_output_dir(base_output, episode_id)
 
     # Audio
-    audio_out = output_audio_path(ep_dir, episode_id)
+    audio_out = episode_path(ep_dir, episode_id, "audio")
     process_audio(input_path, audio_out, config.audio)
     console.print(f"[green]Audio:[/green] {audio_out}")
 
@@ -140,24 +233,33 @@ def process(ctx: click.Context, input_file: str) -> None:
         has_video = False
 
     if has_video:
-        video_out = output_video_path(ep_dir, episode_id)
+        video_out = episode_path(ep_dir, episode_id, "video")
         process_video(input_path, video_out, config.video)
         console.print(f"[green]Video:[/green] {video_out}")
 
 
 @cli.command()
-@click.argument("audio_file", type=click.Path(exists=True))
+@click.argument(
+    "audio_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(),
+    callback=_resolve_existing,
+)
 @click.pass_context
-def transcribe(ctx: click.Context, audio_file: str) -> None:
-    """Transcribe an audio file to timestamped JSON."""
+def transcribe(ctx: click.Context, audio_files: tuple[Path, ...]) -> None:
+    """Transcribe one or more audio files to timestamped JSON."""
+    from pydantic_core import to_json
+
+    from podflow.config import load_config
+    from podflow.utils.logging import console
     from podflow.utils.paths import (
         episode_id_from_file,
         episode_output_dir,
-        output_transcript_path,
+        episode_path,
     )
 
     config = load_config(ctx.obj["config_path"])
-    audio_path = Path(audio_file).resolve()
 
     tc = config.transcription
     if tc.backend == "whisper_local":
@@ -167,46 +269,73 @@ def transcribe(ctx: click.Context, audio_file: str) -> None:
         from podflow.transcription.whisper_api import WhisperAPITranscriber
         transcriber = WhisperAPITranscriber(tc)
 
-    transcript = transcriber.transcribe(audio_path)
+    if len(audio_files) > 1:
+        transcripts = transcriber.transcribe_batch(list(audio_files))
+    else:
+        transcripts = [transcriber.transcribe(audio_files[0])]
 
     base_output = Path(config.output.base_dir)
-    episode_id = episode_id_from_file(audio_path)
-    ep_dir = episode_output_dir(base_output, episode_id)
-    out_path = output_transcript_path(ep_dir, episode_id)
-    out_path.write_text(transcript.model_dump_json(indent=2), encoding="utf-8")
+    for audio_path, transcript in zip(audio_files, transcripts):
+        episode_id = episode_id_from_file(audio_path)
+        ep_dir = episode_output_dir(base_output, episode_id)
+        out_path = episode_path(ep_dir, episode_id, "transcript")
+        out_path.write_bytes(to_json(transcript, indent=2))
 
-    console.print(f"[green]Transcript:[/green] {out_path}")
-    console.print(f"  Segments: {len(transcript.segments)}")
-    console.print(f"  Length:   {len(transcript.full_text)} characters")
+        console.print(f"[green]Transcript:[/green] {out_path}")
+        console.print(f"  Segments: {len(transcript.segments)}")
+        console.print(f"  Length:   {len(transcript.full_text)} characters")
 
 
 @cli.command("generate-metadata")
-@click.argument("transcript_file", type=click.Path(exists=True))
+@click.argument(
+    "transcript_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(),
+    callback=_resolve_existing,
+)
+@click.option("--no-cache", is_flag=True, help="Always call the LLM, ignoring cached metadata")
 @click.pass_context
-def generate_metadata(ctx: click.Context, transcript_file: str) -> None:
-    """Generate AI metadata from a transcript JSON file."""
+def generate_metadata(
+    ctx: click.Context, transcript_files: tuple[Path, ...], no_cache: bool,
+) -> None:
+    """Generate AI metadata from one or more transcript JSON files.
+
+    Several transcripts are packed into shared LLM requests where they fit.
+    """
+    from podflow.config import load_config
     from podflow.metadata.generator import (
-        generate_metadata as gen_meta,
+        generate_metadata_batch,
         load_transcript,
         save_metadata,
     )
+    from podflow.utils.logging import console
 
     config = load_config(ctx.obj["config_path"])
-    transcript = load_transcript(Path(transcript_file))
+    if no_cache:
+        config = _without_metadata_cache(config)
+    transcripts = [load_transcript(path) for path in transcript_files]
 
-    metadata = gen_meta(transcript, config.metadata)
+    results = generate_metadata_batch(transcripts, config.metadata)
 
-    out_path = Path(transcript_file).with_suffix(".metadata.json")
-    save_metadata(metadata, out_path)
+    for transcript_file, metadata in zip(transcript_files, results):
+        out_path = transcript_file.with_suffix(".metadata.json")
+        save_metadata(metadata, out_path)
 
-    console.print(f"[green]Metadata:[/green] {out_path}")
-    console.print(f"  Title:    {metadata.title}")
-    console.print(f"  Tags:     {', '.join(metadata.tags)}")
-    console.print(f"  Chapters: {len(metadata.chapters)}")
+        console.print(f"[green]Metadata:[/green] {out_path}")
+        console.print(f"  Title:    {metadata.title}")
+        console.print(f"  Tags:     {', '.join(metadata.tags)}")
+        console.print(f"  Chapters: {len(metadata.chapters)}")
 
 
 @cli.command("upload-youtube")
-@click.argument("video_file", type=click.Path(exists=True))
+@click.argument(
+    "video_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(),
+    callback=_resolve_existing,
+)
 @click.option("--title", default=None, help="Override video title")
 @click.option("--description", default=None, help="Override video description")
 @click.option(
@@ -217,37 +346,62 @@ def generate_metadata(ctx: click.Context, transcript_file: str) -> None:
 @click.pass_context
 def upload_youtube(
     ctx: click.Context,
-    video_file: str,
+    video_files: tuple[Path, ...],
     title: str | None,
     description: str | None,
     privacy: str | None,
 ) -> None:
-    """Upload a video file to YouTube."""
+    """Upload one or more video files to YouTube."""
+    from podflow.config import load_config
     from podflow.metadata.models import EpisodeMetadata
-    from podflow.upload.youtube import upload_to_youtube
+    from podflow.upload.youtube import upload_many, upload_to_youtube
+    from podflow.utils.logging import console
 
     config = load_config(ctx.obj["config_path"])
 
-    metadata = EpisodeMetadata(
-        title=title or Path(video_file).stem,
-        description=description or "",
-    )
+    if len(video_files) > 1 and title:
+        raise click.BadParameter(
+            "cannot be used with multiple video files", param_hint="'--title'",
+        )
 
-    video_id = upload_to_youtube(
-        video_path=Path(video_file),
-        metadata=metadata,
-        config=config.youtube,
-        privacy=privacy,
-    )
-    url = f"https://www.youtube.com/watch?v={video_id}"
-    console.print(f"[green]Uploaded:[/green] {url}")
+    jobs = [
+        (video_file, EpisodeMetadata(
+            title=title or video_file.stem,
+            description=description or "",
+        ))
+        for video_file in video_files
+    ]
+
+    if len(jobs) > 1:
+        results = upload_many(jobs, config=config.youtube, privacy=privacy)
+    else:
+        video_path, metadata = jobs[0]
+        results = [upload_to_youtube(
+            video_path=video_path,
+            metadata=metadata,
+            config=config.youtube,
+            privacy=privacy,
+        )]
+
+    failed = 0
+    for video_file, result in zip(video_files, results):
+        if isinstance(result, Exception):
+            failed += 1
+            console.print(f"[red bold]Failed:[/red bold] {video_file.name}: {result}")
+        else:
+            url = f"https://www.youtube.com/watch?v={result}"
+            console.print(f"[green]Uploaded:[/green] {url}")
+    if failed:
+        sys.exit(1)
 
 
 @cli.command("update-feed")
 @click.pass_context
 def update_feed(ctx: click.Context) -> None:
     """Regenerate the RSS feed from all processed episodes."""
+    from podflow.config import load_config
     from podflow.feed.generator import generate_feed_xml, load_episodes_from_dir
+    from podflow.utils.logging import console
 
     config = load_config(ctx.obj["config_path"])
     base_output = Path(config.output.base_dir)
@@ -265,21 +419,24 @@ def update_feed(ctx: click.Context) -> None:
 @cli.command("validate-feed")
 @click.argument(
     "feed_file",
-    type=click.Path(exists=True),
+    type=click.Path(),
+    callback=_resolve_existing,
     required=False,
     default=None,
 )
 @click.pass_context
-def validate_feed(ctx: click.Context, feed_file: str | None) -> None:
+def validate_feed(ctx: click.Context, feed_file: Path | None) -> None:
     """Validate a podcast RSS feed for Apple/Spotify compliance."""
+    from podflow.config import load_config
     from podflow.feed.validator import validate_feed as do_validate
+    from podflow.utils.logging import console
 
     config = load_config(ctx.obj["config_path"])
 
     if feed_file is None:
         feed_path = Path(config.output.base_dir) / config.feed.feed_filename
     else:
-        feed_path = Path(feed_file)
+        feed_path = feed_file
 
     result = do_validate(feed_path)
     console.print(result.summary())
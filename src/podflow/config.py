@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Literal
@@ -9,6 +10,17 @@ from typing import Literal
 import yaml
 from pydantic import BaseModel, Field
 
+from podflow.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+    log.warning("libyaml not available, falling back to the pure-Python YAML loader")
+
 
 class AudioConfig(BaseModel):
     bitrate: str = "128k"
@@ -16,6 +28,7 @@ class AudioConfig(BaseModel):
     sample_rate: int = 44100
     target_lufs: float = -16.0
     codec: str = "libmp3lame"
+    two_pass_loudnorm: bool = False
 
 
 class VideoConfig(BaseModel):
@@ -26,6 +39,8 @@ class VideoConfig(BaseModel):
     audio_bitrate: str = "192k"
     max_width: int = 1920
     max_height: int = 1080
+    # Hardware H.264 encoder; "auto" picks the first one that works here
+    hw_accel: Literal["none", "auto", "nvenc", "videotoolbox", "qsv", "vaapi"] = "none"
 
 
 class TranscriptionConfig(BaseModel):
@@ -33,6 +48,20 @@ class TranscriptionConfig(BaseModel):
     model: str = "base"
     language: str | None = None
     prompt: str | None = None
+    # Local backend only. "auto" uses CUDA when available, with float16
+    # there and int8 on CPU.
+    device: str = "auto"
+    compute_type: str = "auto"
+    # CUDA only: GPU(s) to load the model on, and fused attention kernels
+    device_index: int | list[int] = 0
+    flash_attention: bool = False
+    # Keep decoded 16 kHz PCM beside the audio so retries skip ffmpeg
+    cache_pcm: bool = False
+    # Skip silence and music with Silero VAD before decoding
+    vad: bool = True
+    # Reuse transcripts of identical audio; defaults to ~/.cache/podflow/transcripts
+    cache_enabled: bool = True
+    cache_dir: str | None = None
 
 
 class MetadataConfig(BaseModel):
@@ -40,6 +69,11 @@ class MetadataConfig(BaseModel):
     model: str = "claude-sonnet-4-5-20250929"
     max_tags: int = 10
     generate_chapters: bool = True
+    cache_enabled: bool = True
+    # Transcript budget sent to the LLM; ~100k characters of English
+    max_input_tokens: int = 25_000
+    # The model's output token cap; batches are sized so each episode gets 4096
+    max_output_tokens: int = 8192
 
 
 class YouTubeConfig(BaseModel):
@@ -83,6 +117,8 @@ class FeedConfig(BaseModel):
 
 class OutputConfig(BaseModel):
     base_dir: str = "./output"
+    # Also write the state file when a stage starts, not just when it ends
+    persist_running_state: bool = False
 
 
 class PodflowConfig(BaseModel):
@@ -96,34 +132,78 @@ class PodflowConfig(BaseModel):
     output: OutputConfig = Field(default_factory=OutputConfig)
 
 
+CONFIG_FILENAME = "podcast_config.yaml"
+
+
 def find_config_file() -> Path | None:
-    """Search for podcast_config.yaml in cwd and parent dirs."""
-    current = Path.cwd()
-    for directory in [current, *current.parents]:
-        candidate = directory / "podcast_config.yaml"
-        if candidate.exists():
+    """Search for podcast_config.yaml in cwd and parent dirs.
+
+    The result is memoized per working directory for the life of the process.
+    """
+    found = _find_config_file_impl(os.getcwd())
+    return Path(found) if found is not None else None
+
+
+@functools.lru_cache(maxsize=16)
+def _find_config_file_impl(cwd: str) -> str | None:
+    directory = cwd
+    while True:
+        candidate = os.path.join(directory, CONFIG_FILENAME)
+        if os.path.isfile(candidate):
             return candidate
-    return None
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
 
 
 def load_config(config_path: str | Path | None = None) -> PodflowConfig:
-    """Load config from YAML file, falling back to defaults."""
+    """Load config from YAML file, falling back to defaults.
+
+    Parsed configs are cached per (path, mtime), so repeated calls within one
+    process are free until the file changes, and the all-defaults config is a
+    shared instance. Callers must treat the result as read-only (use
+    ``model_copy`` to derive variants). Use ``load_config.cache_clear()`` to
+    drop the cache in tests.
+    """
     if config_path is None:
         found = find_config_file()
         if found is None:
-            return PodflowConfig()
+            return _default_config()
         config_path = found
 
     config_path = Path(config_path)
-    if not config_path.exists():
-        return PodflowConfig()
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return _default_config()
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    return _load_config_cached(str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.cache
+def _default_config() -> PodflowConfig:
+    return PodflowConfig()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> PodflowConfig:
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=_SafeLoader) or {}
 
     return PodflowConfig(**raw)
 
 
+def _clear_config_caches() -> None:
+    """Forget parsed configs and config file lookups."""
+    _load_config_cached.cache_clear()
+    _find_config_file_impl.cache_clear()
+    _default_config.cache_clear()
+
+
+load_config.cache_clear = _clear_config_caches  # type: ignore[attr-defined]
+
+
 def get_api_key(name: str) -> str:
     """Get an API key from environment variables."""
     value = os.environ.get(name, "")
@@ -1,20 +1,52 @@
-"""RSS 2.0 + iTunes feed generation using python-feedgen."""
+"""RSS 2.0 + iTunes feed generation.
+
+Feeds are built directly with lxml; the python-feedgen implementation is kept
+as a fallback (``generate_feed_xml(..., use_feedgen=True)``).
+"""
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
 
 from feedgen.feed import FeedGenerator
+from lxml import etree
 
 from podflow.config import FeedConfig, HostingConfig
-from podflow.metadata.models import EpisodeInfo
+from podflow.metadata.models import EpisodeInfo, EpisodeMetadata
+from podflow.state import flush_state_writes
 from podflow.utils.logging import get_logger
 from podflow.utils.time_format import seconds_to_hms
 
+try:
+    # orjson parses bytes directly and is several times faster than json;
+    # its JSONDecodeError subclasses json.JSONDecodeError.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 log = get_logger(__name__)
 
+ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+_NSMAP = {"itunes": ITUNES_NS, "atom": ATOM_NS, "content": CONTENT_NS}
+_IT = f"{{{ITUNES_NS}}}"
+
+# Undated episodes sort last
+_MIN_DT = datetime.min.replace(tzinfo=timezone.utc)
+
+# Naming of per-episode state files, see podflow.state.state_file_path
+_STATE_PREFIX = ".podflow_state_"
+_STATE_SUFFIX = ".json"
+
 
 def create_feed(config: FeedConfig) -> FeedGenerator:
     """Create a new podcast RSS feed with iTunes extensions."""
@@ -51,7 +83,7 @@ def add_episode_to_feed(
         log.warning("No metadata for episode, skipping feed entry")
         return
 
-    fe = fg.add_entry()
+    fe = fg.add_entry(order="append")
     meta = episode.metadata
 
     episode_id = episode.audio_url or episode.input_file
@@ -93,66 +125,168 @@ def generate_feed_xml(
     config: FeedConfig,
     episodes: list[EpisodeInfo],
     output_path: Path,
+    use_feedgen: bool = False,
 ) -> Path:
-    """Generate the full RSS feed XML file."""
-    fg = create_feed(config)
+    """Generate the full RSS feed XML file.
 
-    # Sort episodes by publish date (newest first)
-    sorted_episodes = sorted(
-        episodes,
-        key=lambda e: e.publish_date or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
-
-    for ep in sorted_episodes:
-        add_episode_to_feed(fg, ep)
+    Sorts ``episodes`` in place by publish date (newest first).
+    """
+    episodes.sort(key=_publish_sort_key, reverse=True)
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fg.rss_file(str(output_path), pretty=True)
 
-    log.info("Feed written to %s (%d episodes)", output_path, len(sorted_episodes))
+    if use_feedgen:
+        fg = create_feed(config)
+        for ep in episodes:
+            add_episode_to_feed(fg, ep)
+        fg.rss_file(str(output_path), pretty=True)
+    else:
+        root = _build_feed_etree(config, episodes)
+        output_path.write_bytes(
+            etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+        )
+
+    log.info("Feed written to %s (%d episodes)", output_path, len(episodes))
     return output_path
 
 
-def load_episodes_from_dir(output_base_dir: Path) -> list[EpisodeInfo]:
-    """Scan the output directory for completed episodes with metadata."""
-    episodes = []
-    if not output_base_dir.exists():
-        return episodes
+def _publish_sort_key(episode: EpisodeInfo) -> datetime:
+    return episode.publish_date or _MIN_DT
 
-    for episode_dir in output_base_dir.iterdir():
-        if not episode_dir.is_dir():
-            continue
-        meta_files = list(episode_dir.glob("*_metadata.json"))
-        if not meta_files:
+
+@functools.lru_cache(maxsize=4)
+def _channel_template(config_json: str) -> etree._Element:
+    """Channel-level skeleton for a feed config; callers must deepcopy it."""
+    config = FeedConfig.model_validate_json(config_json)
+    _se = etree.SubElement
+
+    root = etree.Element("rss", version="2.0", nsmap=_NSMAP)
+    channel = _se(root, "channel")
+    _se(channel, "title").text = config.title
+    _se(channel, "link").text = config.link
+    _se(channel, "description").text = config.description
+    _se(channel, "docs").text = "http://www.rssboard.org/rss-specification"
+    _se(channel, "generator").text = "PodFlow"
+    if config.image_url:
+        image = _se(channel, "image")
+        _se(image, "url").text = config.image_url
+        _se(image, "title").text = config.title
+        _se(image, "link").text = config.link
+    _se(channel, "language").text = config.language
+    _se(channel, "lastBuildDate")  # filled in per render
+
+    _se(channel, _IT + "author").text = config.author
+    if config.category:
+        _se(channel, _IT + "category", text=config.category)
+    if config.image_url:
+        _se(channel, _IT + "image", href=config.image_url)
+    _se(channel, _IT + "explicit").text = "yes" if config.explicit else "no"
+    owner = _se(channel, _IT + "owner")
+    _se(owner, _IT + "name").text = config.author
+    _se(owner, _IT + "email").text = config.email
+
+    return root
+
+
+def _build_feed_etree(config: FeedConfig, episodes: list[EpisodeInfo]) -> etree._Element:
+    """Build the RSS tree in one pass; mirrors the output of create_feed/add_episode_to_feed."""
+    _se = etree.SubElement
+
+    root = copy.deepcopy(_channel_template(config.model_dump_json()))
+    channel = root[0]
+    now = datetime.now(timezone.utc)
+    channel.find("lastBuildDate").text = format_datetime(now)
+
+    for episode in episodes:
+        meta = episode.metadata
+        if not meta:
+            log.warning("No metadata for episode, skipping feed entry")
             continue
 
-        meta_path = meta_files[0]
-        try:
-            data = json.loads(meta_path.read_text(encoding="utf-8"))
-            # Look for corresponding state file
-            state_files = list(output_base_dir.glob(f".podflow_state_{episode_dir.name}.json"))
-            ep_info = EpisodeInfo(
-                input_file=episode_dir.name,
-                metadata_file=str(meta_path),
+        item = _se(channel, "item")
+        _se(item, "title").text = meta.title
+        _se(item, "description").text = meta.description
+        if meta.show_notes:
+            _se(item, f"{{{CONTENT_NS}}}encoded").text = meta.show_notes
+        _se(item, "guid", isPermaLink="false").text = episode.audio_url or episode.input_file
+        for tag in meta.tags:
+            _se(item, "category").text = tag
+        if episode.audio_url:
+            _se(
+                item, "enclosure",
+                url=episode.audio_url,
+                length=str(episode.audio_size_bytes or 0),
+                type="audio/mpeg",
             )
-            from podflow.metadata.models import EpisodeMetadata
-            ep_info.metadata = EpisodeMetadata(**data)
-
-            # Try to find audio info from state
-            if state_files:
-                state_data = json.loads(state_files[0].read_text(encoding="utf-8"))
-                host_outputs = state_data.get("stages", {}).get("host_audio", {}).get("outputs", {})
-                ep_info.audio_url = host_outputs.get("audio_url")
-                ep_info.audio_size_bytes = host_outputs.get("audio_size_bytes")
-                ep_info.audio_duration_seconds = host_outputs.get("audio_duration_seconds")
-                yt_outputs = state_data.get("stages", {}).get("upload_youtube", {}).get("outputs", {})
-                ep_info.youtube_url = yt_outputs.get("youtube_url")
-
-            episodes.append(ep_info)
-        except (json.JSONDecodeError, KeyError) as e:
-            log.warning("Skipping %s: %s", episode_dir.name, e)
-            continue
+        _se(item, "pubDate").text = format_datetime(episode.publish_date or now)
 
-    return episodes
+        if episode.audio_duration_seconds:
+            _se(item, _IT + "duration").text = seconds_to_hms(episode.audio_duration_seconds)
+        _se(item, _IT + "summary").text = meta.summary or meta.description
+        if episode.episode_number:
+            _se(item, _IT + "episode").text = str(episode.episode_number)
+
+    return root
+
+
+def load_episodes_from_dir(output_base_dir: Path) -> list[EpisodeInfo]:
+    """Scan the output directory for completed episodes with metadata.
+
+    Episode directories are parsed on a thread pool since the work is
+    dominated by file-open latency (notably on network-backed storage).
+    """
+    if not output_base_dir.exists():
+        return []
+
+    # Audio URLs are read back from state files, which may still be queued.
+    # Another episode's failed write is its own run's error, not the feed's.
+    flush_state_writes(raise_errors=False)
+
+    # One directory scan finds both the episode dirs and their state files
+    episode_dirs: list[Path] = []
+    state_index: dict[str, Path] = {}
+    with os.scandir(output_base_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                episode_dirs.append(Path(entry.path))
+            elif name.startswith(_STATE_PREFIX) and name.endswith(_STATE_SUFFIX):
+                state_index[name[len(_STATE_PREFIX):-len(_STATE_SUFFIX)]] = Path(entry.path)
+
+    if not episode_dirs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(episode_dirs))) as pool:
+        results = pool.map(lambda d: _load_one(d, state_index.get(d.name)), episode_dirs)
+        return [ep for ep in results if ep is not None]
+
+
+def _load_one(episode_dir: Path, state_path: Path | None) -> EpisodeInfo | None:
+    meta_files = list(episode_dir.glob("*_metadata.json"))
+    if not meta_files:
+        return None
+
+    meta_path = meta_files[0]
+    try:
+        data = _json_loads(meta_path.read_bytes())
+        ep_info = EpisodeInfo(
+            input_file=episode_dir.name,
+            metadata_file=str(meta_path),
+        )
+        ep_info.metadata = EpisodeMetadata(**data)
+
+        # Try to find audio info from state
+        if state_path is not None:
+            state_data = _json_loads(state_path.read_bytes())
+            host_outputs = state_data.get("stages", {}).get("host_audio", {}).get("outputs", {})
+            ep_info.audio_url = host_outputs.get("audio_url")
+            ep_info.audio_size_bytes = host_outputs.get("audio_size_bytes")
+            ep_info.audio_duration_seconds = host_outputs.get("audio_duration_seconds")
+            yt_outputs = state_data.get("stages", {}).get("upload_youtube", {}).get("outputs", {})
+            ep_info.youtube_url = yt_outputs.get("youtube_url")
+
+        return ep_info
+    except (json.JSONDecodeError, KeyError) as e:
+        log.warning("Skipping %s: %s", episode_dir.name, e)
+        return None
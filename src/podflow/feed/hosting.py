@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -11,6 +14,18 @@ from podflow.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MAX_UPLOAD_CONCURRENCY = 16
+
+# Reuse one SSH connection across consecutive scp calls (e.g. episode + feed)
+# instead of paying the TCP + key exchange + auth handshake every time.
+SSH_MULTIPLEX_OPTIONS = (
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/podflow-%C",
+    "-o", "ControlPersist=60s",
+)
+
 
 class HostingResult:
     def __init__(self, public_url: str, size_bytes: int):
@@ -31,14 +46,15 @@ def upload_audio(
     if remote_filename is None:
         remote_filename = audio_path.name
 
-    size_bytes = audio_path.stat().st_size
+    st = audio_path.stat()
+    size_bytes = st.st_size
 
     if config.method == "s3":
         url = _upload_s3(audio_path, remote_filename, config)
     elif config.method == "scp":
         url = _upload_scp(audio_path, remote_filename, config)
     elif config.method == "local":
-        url = _upload_local(audio_path, remote_filename, config)
+        url = _upload_local(audio_path, remote_filename, config, st)
     else:
         raise ValueError(f"Unknown hosting method: {config.method}")
 
@@ -48,28 +64,38 @@ def upload_audio(
 
 def _upload_s3(audio_path: Path, remote_filename: str, config: HostingConfig) -> str:
     """Upload to S3-compatible storage (AWS S3, Cloudflare R2, etc.)."""
-    import boto3
-
-    session_kwargs: dict = {}
-    client_kwargs: dict = {}
-
-    if config.s3_endpoint_url:
-        client_kwargs["endpoint_url"] = config.s3_endpoint_url
-    if config.s3_region and config.s3_region != "auto":
-        session_kwargs["region_name"] = config.s3_region
-
-    session = boto3.Session(**session_kwargs)
-    s3 = session.client("s3", **client_kwargs)
+    from boto3.s3.transfer import TransferConfig
+
+    region = config.s3_region if config.s3_region and config.s3_region != "auto" else None
+    s3 = _s3_client(config.s3_endpoint_url, region)
+
+    # Episode MP3s are typically 50-300 MB: use larger parts and more
+    # concurrent part uploads than the boto3 defaults to fill the uplink.
+    transfer_config = TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=MULTIPART_CHUNKSIZE,
+        max_concurrency=MAX_UPLOAD_CONCURRENCY,
+        use_threads=True,
+    )
 
     key = f"{config.s3_prefix}{remote_filename}"
-    log.info("Uploading %s to s3://%s/%s", audio_path.name, config.s3_bucket, key)
+    digest = _file_sha256(audio_path)
 
-    s3.upload_file(
-        str(audio_path),
-        config.s3_bucket,
-        key,
-        ExtraArgs={"ContentType": "audio/mpeg", "ACL": "public-read"},
-    )
+    if _s3_object_matches(s3, config.s3_bucket, key, digest):
+        log.info("s3://%s/%s is already up to date, skipping upload", config.s3_bucket, key)
+    else:
+        log.info("Uploading %s to s3://%s/%s", audio_path.name, config.s3_bucket, key)
+        s3.upload_file(
+            str(audio_path),
+            config.s3_bucket,
+            key,
+            ExtraArgs={
+                "ContentType": "audio/mpeg",
+                "ACL": "public-read",
+                "Metadata": {"sha256": digest},
+            },
+            Config=transfer_config,
+        )
 
     if config.s3_public_url_base:
         base = config.s3_public_url_base.rstrip("/")
@@ -77,6 +103,45 @@ def _upload_s3(audio_path: Path, remote_filename: str, config: HostingConfig) ->
     return f"https://{config.s3_bucket}.s3.amazonaws.com/{key}"
 
 
+def _file_sha256(path: Path) -> str:
+    """Stream a file through SHA-256 (OpenSSL, using SHA-NI where available)."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _s3_object_matches(s3, bucket: str, key: str, sha256: str) -> bool:
+    """Whether the object at key was uploaded from identical bytes."""
+    from botocore.exceptions import ClientError
+
+    try:
+        head = s3.head_object(Bucket=bucket, Key=key)
+    except ClientError:
+        return False
+    return head.get("Metadata", {}).get("sha256") == sha256
+
+
+@functools.lru_cache(maxsize=4)
+def _s3_client(endpoint_url: str | None, region: str | None):
+    """Build (once per endpoint/region) an S3 client; boto3 clients are thread-safe."""
+    import boto3
+
+    session_kwargs: dict = {}
+    client_kwargs: dict = {}
+
+    if endpoint_url:
+        client_kwargs["endpoint_url"] = endpoint_url
+    if region:
+        session_kwargs["region_name"] = region
+
+    session = boto3.Session(**session_kwargs)
+    return session.client("s3", **client_kwargs)
+
+
 def _upload_scp(audio_path: Path, remote_filename: str, config: HostingConfig) -> str:
     """Upload via SCP to a remote server."""
     remote_path = f"{config.scp_remote_path.rstrip('/')}/{remote_filename}"
@@ -84,24 +149,39 @@ def _upload_scp(audio_path: Path, remote_filename: str, config: HostingConfig) -
 
     log.info("Uploading %s via SCP to %s", audio_path.name, target)
 
-    subprocess.run(
-        ["scp", str(audio_path), target],
-        check=True,
-        capture_output=True,
-    )
+    try:
+        subprocess.run(
+            ["scp", *SSH_MULTIPLEX_OPTIONS, str(audio_path), target],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = (e.stderr or b"").decode(errors="replace").strip()
+        raise RuntimeError(
+            f"SCP upload to {target} failed (exit {e.returncode}): {stderr}"
+        ) from e
 
     base = config.scp_public_url_base.rstrip("/")
     return f"{base}/{remote_filename}"
 
 
-def _upload_local(audio_path: Path, remote_filename: str, config: HostingConfig) -> str:
+def _upload_local(
+    audio_path: Path,
+    remote_filename: str,
+    config: HostingConfig,
+    st: os.stat_result,
+) -> str:
     """Copy to a local directory for serving by a web server."""
     dest_dir = Path(config.local_dir)
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest_path = dest_dir / remote_filename
 
     log.info("Copying %s to %s", audio_path.name, dest_path)
-    shutil.copy2(str(audio_path), str(dest_path))
+    # copyfile uses the kernel fast paths (sendfile/copy_file_range on Linux);
+    # only the timestamps are carried over, reusing the caller's stat.
+    shutil.copyfile(audio_path, dest_path)
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
 
     base = config.local_public_url_base.rstrip("/")
     return f"{base}/{remote_filename}"
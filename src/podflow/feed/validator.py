@@ -2,17 +2,49 @@
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from podflow.utils.logging import get_logger
 
+try:
+    from lxml import etree as ET
+
+    _ParseError: type[Exception] = ET.XMLSyntaxError
+    # Feeds come from the user; never expand entities or fetch anything
+    _PARSE_OPTIONS: dict = {"resolve_entities": False, "no_network": True, "huge_tree": False}
+except ImportError:  # pragma: no cover - lxml is a hard dependency via feedgen
+    import xml.etree.ElementTree as ET
+
+    _ParseError = ET.ParseError
+    _PARSE_OPTIONS = {}
+
 log = get_logger(__name__)
 
 ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
 ATOM_NS = "http://www.w3.org/2005/Atom"
 
+_ITUNES_AUTHOR = f"{{{ITUNES_NS}}}author"
+_ITUNES_OWNER = f"{{{ITUNES_NS}}}owner"
+_ITUNES_EXPLICIT = f"{{{ITUNES_NS}}}explicit"
+_ITUNES_IMAGE = f"{{{ITUNES_NS}}}image"
+_ITUNES_CATEGORY = f"{{{ITUNES_NS}}}category"
+
+# (tag, display name) pairs checked with a single pass over the children
+_REQUIRED_CHANNEL_TAGS = (
+    ("title", "title"),
+    ("description", "description"),
+    ("link", "link"),
+    (_ITUNES_AUTHOR, "itunes:author"),
+    (_ITUNES_OWNER, "itunes:owner"),
+    (_ITUNES_EXPLICIT, "itunes:explicit"),
+)
+_REQUIRED_ITEM_TAGS = (
+    ("title", "title"),
+    ("description", "description"),
+)
+_ENCLOSURE_TYPES = frozenset(("audio/mpeg", "audio/x-m4a", "audio/mp4", "video/mp4"))
+
 
 @dataclass
 class ValidationResult:
@@ -47,40 +79,72 @@ def validate_feed(feed_path: Path) -> ValidationResult:
         result.errors.append(f"Feed file not found: {feed_path}")
         return result
 
+    # Stream the document: channel-level checks run once </channel> has been
+    # seen, items are validated and discarded as soon as each </item> closes,
+    # so memory stays flat regardless of the number of episodes.
+    items_result = ValidationResult()
+    item_count = 0
+    depth = 0
+    root = None
+    channel = None
+    channel_done = False
+
     try:
-        tree = ET.parse(str(feed_path))
-    except ET.ParseError as e:
-        result.errors.append(f"XML parse error: {e}")
+        for event, elem in ET.iterparse(
+            str(feed_path), events=("start", "end"), **_PARSE_OPTIONS,
+        ):
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                    # Must be RSS 2.0
+                    if root.tag != "rss":
+                        result.errors.append(f"Root element must be <rss>, got <{root.tag}>")
+                        return result
+                    version = root.get("version", "")
+                    if version != "2.0":
+                        result.errors.append(f"RSS version must be 2.0, got '{version}'")
+                elif depth == 2 and elem.tag == "channel" and channel is None:
+                    channel = elem
+                continue
+
+            depth -= 1
+            if channel_done or channel is None:
+                continue
+            if depth == 2 and elem.tag == "item":
+                item_count += 1
+                _validate_item(elem, f"Episode {item_count}", items_result)
+                elem.clear()
+                channel.remove(elem)
+            elif elem is channel:
+                _validate_channel(channel, result)
+                channel_done = True
+    except _ParseError as e:
+        return ValidationResult(errors=[f"XML parse error: {e}"])
+
+    if channel is None:
+        result.errors.append("Missing <channel> element")
         return result
 
-    root = tree.getroot()
+    if not item_count:
+        result.warnings.append("Feed has no episodes")
 
-    # Must be RSS 2.0
-    if root.tag != "rss":
-        result.errors.append(f"Root element must be <rss>, got <{root.tag}>")
-        return result
+    result.errors.extend(items_result.errors)
+    result.warnings.extend(items_result.warnings)
 
-    version = root.get("version", "")
-    if version != "2.0":
-        result.errors.append(f"RSS version must be 2.0, got '{version}'")
+    log.info("Validation complete: %d errors, %d warnings", len(result.errors), len(result.warnings))
+    return result
 
-    channel = root.find("channel")
-    if channel is None:
-        result.errors.append("Missing <channel> element")
-        return result
 
-    # Required channel elements
-    _require_element(channel, "title", result)
-    _require_element(channel, "description", result)
-    _require_element(channel, "link", result)
+def _validate_channel(channel: ET.Element, result: ValidationResult) -> None:
+    children = _first_children(channel)
 
-    # iTunes required elements
-    _require_element(channel, f"{{{ITUNES_NS}}}author", result, "itunes:author")
-    _require_element(channel, f"{{{ITUNES_NS}}}owner", result, "itunes:owner")
-    _require_element(channel, f"{{{ITUNES_NS}}}explicit", result, "itunes:explicit")
+    # Required channel elements (RSS + iTunes)
+    for tag, name in _REQUIRED_CHANNEL_TAGS:
+        _check_required(children.get(tag), name, result)
 
     # iTunes recommended elements
-    image = channel.find(f"{{{ITUNES_NS}}}image")
+    image = children.get(_ITUNES_IMAGE)
     if image is None:
         result.warnings.append("Missing itunes:image — required by Apple Podcasts")
     else:
@@ -90,59 +154,54 @@ def validate_feed(feed_path: Path) -> ValidationResult:
         elif not href.startswith("https://"):
             result.warnings.append("itunes:image should use HTTPS URL")
 
-    category = channel.find(f"{{{ITUNES_NS}}}category")
-    if category is None:
+    if _ITUNES_CATEGORY not in children:
         result.warnings.append("Missing itunes:category — recommended for discoverability")
 
-    # Validate items (episodes)
-    items = channel.findall("item")
-    if not items:
-        result.warnings.append("Feed has no episodes")
 
-    for i, item in enumerate(items, 1):
-        prefix = f"Episode {i}"
-        _require_element(item, "title", result, f"{prefix}: title")
-        _require_element(item, "description", result, f"{prefix}: description")
-
-        enclosure = item.find("enclosure")
-        if enclosure is None:
-            result.errors.append(f"{prefix}: Missing <enclosure> element")
-        else:
-            url = enclosure.get("url", "")
-            if not url:
-                result.errors.append(f"{prefix}: enclosure missing 'url' attribute")
-            elif not url.startswith("https://") and not url.startswith("http://"):
-                result.warnings.append(f"{prefix}: enclosure URL should be HTTPS")
-
-            enc_type = enclosure.get("type", "")
-            if enc_type not in ("audio/mpeg", "audio/x-m4a", "audio/mp4", "video/mp4"):
-                result.warnings.append(
-                    f"{prefix}: enclosure type '{enc_type}' may not be supported"
-                )
-
-            length = enclosure.get("length", "0")
-            if length == "0":
-                result.warnings.append(f"{prefix}: enclosure length is 0")
-
-        guid = item.find("guid")
-        if guid is None:
-            result.warnings.append(f"{prefix}: Missing <guid> — recommended for deduplication")
+def _validate_item(item: ET.Element, prefix: str, result: ValidationResult) -> None:
+    children = _first_children(item)
 
-    log.info("Validation complete: %d errors, %d warnings", len(result.errors), len(result.warnings))
-    return result
+    for tag, name in _REQUIRED_ITEM_TAGS:
+        _check_required(children.get(tag), f"{prefix}: {name}", result)
+
+    enclosure = children.get("enclosure")
+    if enclosure is None:
+        result.errors.append(f"{prefix}: Missing <enclosure> element")
+    else:
+        url = enclosure.get("url", "")
+        if not url:
+            result.errors.append(f"{prefix}: enclosure missing 'url' attribute")
+        elif not url.startswith("https://") and not url.startswith("http://"):
+            result.warnings.append(f"{prefix}: enclosure URL should be HTTPS")
+
+        enc_type = enclosure.get("type", "")
+        if enc_type not in _ENCLOSURE_TYPES:
+            result.warnings.append(
+                f"{prefix}: enclosure type '{enc_type}' may not be supported"
+            )
+
+        length = enclosure.get("length", "0")
+        if length == "0":
+            result.warnings.append(f"{prefix}: enclosure length is 0")
+
+    if "guid" not in children:
+        result.warnings.append(f"{prefix}: Missing <guid> — recommended for deduplication")
+
+
+def _first_children(parent: ET.Element) -> dict:
+    """Map each child tag to its first occurrence (what ``parent.find(tag)`` returns)."""
+    children: dict = {}
+    for child in parent:
+        children.setdefault(child.tag, child)
+    return children
 
 
-def _require_element(
-    parent: ET.Element,
-    tag: str,
+def _check_required(
+    el: ET.Element | None,
+    name: str,
     result: ValidationResult,
-    display_name: str | None = None,
-) -> ET.Element | None:
-    el = parent.find(tag)
-    name = display_name or tag
+) -> None:
     if el is None:
         result.errors.append(f"Missing required element: {name}")
-        return None
-    if not (el.text or "").strip() and not el.attrib:
+    elif not (el.text or "").strip() and not el.attrib:
         result.warnings.append(f"Element {name} is empty")
-    return el
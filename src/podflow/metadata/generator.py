@@ -2,84 +2,335 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from podflow.config import MetadataConfig, get_api_key
 from podflow.metadata.models import Chapter, EpisodeMetadata, Transcript
-from podflow.metadata.prompts import SYSTEM_PROMPT, build_metadata_prompt
+from podflow.metadata.prompts import (
+    SYSTEM_PROMPT,
+    build_batch_metadata_prompt,
+    build_metadata_prompt,
+)
 from podflow.utils.logging import get_logger
+from podflow.utils.paths import atomic_write_bytes, user_cache_dir
 
 log = get_logger(__name__)
 
+# Rough average for English text, used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+
+# Log streaming progress roughly every this many characters
+_PROGRESS_CHARS = 2000
+
+# Output token allowance per episode in an LLM reply
+_MAX_OUTPUT_TOKENS = 4096
+
 
 def generate_metadata(
     transcript: Transcript,
     config: MetadataConfig,
 ) -> EpisodeMetadata:
     """Generate episode metadata from a transcript using an LLM."""
+    transcript_text = _prepare_transcript(transcript, config)
+    cache_path = _cache_entry(transcript_text, config)
+    metadata = _read_cache(cache_path)
+    if metadata is None:
+        metadata = _generate_single(transcript_text, config, cache_path)
+    return metadata
+
+
+def generate_metadata_batch(
+    transcripts: list[Transcript],
+    config: MetadataConfig,
+    max_batch_size: int = 4,
+) -> list[EpisodeMetadata]:
+    """Generate metadata for several transcripts, sharing LLM calls.
+
+    Up to ``max_batch_size`` transcripts go into one request as long as
+    together they fit ``config.max_input_tokens`` and their replies fit
+    ``config.max_output_tokens``; larger ones are sent on their own. Cache
+    entries are shared with generate_metadata, and a batch that fails or
+    whose reply can't be matched back to its episodes is retried one by one.
+    Results are returned in input order.
+    """
+    max_batch_size = max(1, min(max_batch_size, config.max_output_tokens // _MAX_OUTPUT_TOKENS))
+    results: list[EpisodeMetadata | None] = [None] * len(transcripts)
+    batch: list[tuple[int, str, Path | None]] = []
+    batch_tokens = 0
+
+    def flush() -> None:
+        if len(batch) == 1:
+            i, text, cache_path = batch[0]
+            results[i] = _generate_single(text, config, cache_path)
+        elif batch:
+            for (i, _, _), metadata in zip(batch, _generate_batch(batch, config)):
+                results[i] = metadata
+        batch.clear()
+
+    for i, transcript in enumerate(transcripts):
+        text = _prepare_transcript(transcript, config)
+        cache_path = _cache_entry(text, config)
+        results[i] = _read_cache(cache_path)
+        if results[i] is not None:
+            continue
+
+        tokens = _count_tokens(text, config)
+        if batch and (len(batch) == max_batch_size
+                      or batch_tokens + tokens > config.max_input_tokens):
+            flush()
+            batch_tokens = 0
+        batch.append((i, text, cache_path))
+        batch_tokens += tokens
+    flush()
+
+    return results
+
+
+def _prepare_transcript(transcript: Transcript, config: MetadataConfig) -> str:
     transcript_text = transcript.to_timestamped_text()
     if not transcript_text:
         transcript_text = transcript.full_text
 
     # Truncate very long transcripts to avoid exceeding context limits
-    max_chars = 100_000
-    if len(transcript_text) > max_chars:
-        log.warning("Transcript truncated from %d to %d characters", len(transcript_text), max_chars)
-        transcript_text = transcript_text[:max_chars]
+    return _truncate_transcript(transcript_text, config)
+
 
-    prompt = build_metadata_prompt(
+def _single_prompt(transcript_text: str, config: MetadataConfig) -> str:
+    return build_metadata_prompt(
         transcript_text=transcript_text,
         max_tags=config.max_tags,
         generate_chapters=config.generate_chapters,
     )
 
+
+def _cache_entry(transcript_text: str, config: MetadataConfig) -> Path | None:
+    """Cache file for a single-episode request, or None if caching is off."""
+    if not config.cache_enabled:
+        return None
+    return _cache_path(_single_prompt(transcript_text, config), config)
+
+
+def _read_cache(cache_path: Path | None) -> EpisodeMetadata | None:
+    if cache_path is None:
+        return None
+    try:
+        if not cache_path.exists():
+            return None
+        metadata = EpisodeMetadata.model_validate_json(cache_path.read_bytes())
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring unreadable metadata cache entry %s: %s", cache_path.name, e)
+        return None
+    log.info("Using cached metadata for this transcript (%s)", cache_path.name)
+    return metadata
+
+
+def _write_cache(cache_path: Path | None, metadata: EpisodeMetadata) -> None:
+    """Store generated metadata; a cache that can't be written is only a warning."""
+    if cache_path is None:
+        return
+    try:
+        atomic_write_bytes(cache_path, to_json(metadata))
+    except OSError as e:
+        log.warning("Could not write metadata cache entry %s: %s", cache_path.name, e)
+
+
+def _generate_single(
+    transcript_text: str, config: MetadataConfig, cache_path: Path | None,
+) -> EpisodeMetadata:
     log.info("Generating metadata via %s (%s)", config.provider, config.model)
+    raw = _complete(
+        _single_prompt(transcript_text, config), config,
+        min(_MAX_OUTPUT_TOKENS, config.max_output_tokens),
+    )
+    metadata = _parse_response(raw)
+    _write_cache(cache_path, metadata)
+    return metadata
+
+
+def _generate_batch(
+    batch: list[tuple[int, str, Path | None]], config: MetadataConfig,
+) -> list[EpisodeMetadata]:
+    log.info(
+        "Generating metadata for %d episodes in one request via %s (%s)",
+        len(batch), config.provider, config.model,
+    )
+    prompt = build_batch_metadata_prompt(
+        [text for _, text, _ in batch],
+        max_tags=config.max_tags,
+        generate_chapters=config.generate_chapters,
+    )
+    try:
+        raw = _complete(prompt, config, _MAX_OUTPUT_TOKENS * len(batch))
+        results = _parse_batch_response(raw, len(batch))
+    except (ValueError, KeyError, TypeError, *_provider_errors(config)) as e:
+        log.warning("Could not use batched metadata reply (%s), generating one by one", e)
+        return [_generate_single(text, config, cache_path) for _, text, cache_path in batch]
+
+    for (_, _, cache_path), metadata in zip(batch, results):
+        _write_cache(cache_path, metadata)
+    return results
+
+
+def _complete(prompt: str, config: MetadataConfig, max_tokens: int) -> str:
+    if config.provider == "anthropic":
+        return _call_anthropic(prompt, config, max_tokens)
+    return _call_openai(prompt, config, max_tokens)
+
 
+def _provider_errors(config: MetadataConfig) -> tuple[type[Exception], ...]:
+    """API errors of the configured provider's SDK (rejections, timeouts, ...)."""
     if config.provider == "anthropic":
-        raw = _call_anthropic(prompt, config)
+        import anthropic
+
+        return (anthropic.APIError,)
+    import openai
+
+    return (openai.APIError,)
+
+
+def _count_tokens(text: str, config: MetadataConfig) -> int:
+    encoding = _tiktoken_encoding(config.model) if config.provider == "openai" else None
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def _truncate_transcript(text: str, config: MetadataConfig) -> str:
+    """Cut the transcript to at most ``config.max_input_tokens`` tokens.
+
+    Counts exactly with tiktoken for OpenAI models when it is installed,
+    otherwise assumes ~4 characters per token.
+    """
+    limit = config.max_input_tokens
+    encoding = _tiktoken_encoding(config.model) if config.provider == "openai" else None
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= limit:
+            return text
+        truncated = encoding.decode(tokens[:limit])
     else:
-        raw = _call_openai(prompt, config)
+        max_chars = limit * _CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        truncated = text[:max_chars]
+
+    log.warning(
+        "Transcript truncated from %d to %d characters (%d token budget)",
+        len(text), len(truncated), limit,
+    )
+    return truncated
+
 
-    return _parse_response(raw)
+@functools.lru_cache(maxsize=4)
+def _tiktoken_encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
 
 
-def _call_anthropic(prompt: str, config: MetadataConfig) -> str:
+def _cache_path(prompt: str, config: MetadataConfig) -> Path:
+    """Content-addressed cache entry for an LLM request.
+
+    The prompt already embeds the transcript, tag count and chapter setting.
+    """
+    key = hashlib.sha256(
+        f"{config.provider}|{config.model}|{SYSTEM_PROMPT}|{prompt}".encode("utf-8")
+    ).hexdigest()
+    return user_cache_dir("metadata") / f"{key}.json"
+
+
+@functools.lru_cache(maxsize=4)
+def _anthropic_client(api_key: str):
+    """One client per key, so its connection pool stays warm across episodes."""
     import anthropic
 
-    api_key = get_api_key("ANTHROPIC_API_KEY")
-    client = anthropic.Anthropic(api_key=api_key)
+    return anthropic.Anthropic(api_key=api_key)
+
 
-    message = client.messages.create(
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """One client per key, so its connection pool stays warm across episodes."""
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
+
+
+def _call_anthropic(
+    prompt: str, config: MetadataConfig, max_tokens: int = _MAX_OUTPUT_TOKENS,
+) -> str:
+    client = _anthropic_client(get_api_key("ANTHROPIC_API_KEY"))
+
+    with client.messages.stream(
         model=config.model,
-        max_tokens=4096,
+        max_tokens=max_tokens,
         system=SYSTEM_PROMPT,
         messages=[{"role": "user", "content": prompt}],
-    )
-    return message.content[0].text
+    ) as stream:
+        return _collect_stream(stream.text_stream)
 
 
-def _call_openai(prompt: str, config: MetadataConfig) -> str:
-    import openai
-
-    api_key = get_api_key("OPENAI_API_KEY")
-    client = openai.OpenAI(api_key=api_key)
+def _call_openai(
+    prompt: str, config: MetadataConfig, max_tokens: int = _MAX_OUTPUT_TOKENS,
+) -> str:
+    client = _openai_client(get_api_key("OPENAI_API_KEY"))
 
-    response = client.chat.completions.create(
+    stream = client.chat.completions.create(
         model=config.model,
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ],
-        max_tokens=4096,
+        max_tokens=max_tokens,
         temperature=0.7,
+        stream=True,
     )
-    return response.choices[0].message.content or ""
+    return _collect_stream(
+        chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices
+    )
+
+
+def _collect_stream(chunks: Iterable[str]) -> str:
+    """Join streamed response text, logging progress as it arrives."""
+    parts = []
+    received = 0
+    next_report = _PROGRESS_CHARS
+    for text in chunks:
+        parts.append(text)
+        received += len(text)
+        if received >= next_report:
+            log.debug("Received %d characters of LLM response", received)
+            next_report = received + _PROGRESS_CHARS
+    return "".join(parts)
 
 
 def _parse_response(raw: str) -> EpisodeMetadata:
     """Parse LLM JSON response into EpisodeMetadata."""
-    # Strip markdown code fences if present
+    return _metadata_from_dict(json.loads(_strip_fences(raw)))
+
+
+def _parse_batch_response(raw: str, count: int) -> list[EpisodeMetadata]:
+    """Parse a batched ``{"episodes": [...]}`` reply, one entry per transcript."""
+    episodes = json.loads(_strip_fences(raw))["episodes"]
+    if not isinstance(episodes, list) or not all(isinstance(e, dict) for e in episodes):
+        raise ValueError("'episodes' must be a list of objects")
+    if len(episodes) != count:
+        raise ValueError(f"expected {count} episodes, got {len(episodes)}")
+    return [_metadata_from_dict(data) for data in episodes]
+
+
+def _strip_fences(raw: str) -> str:
+    """Strip markdown code fences if present."""
     text = raw.strip()
     if text.startswith("```"):
         lines = text.split("\n")
@@ -87,9 +338,10 @@ def _parse_response(raw: str) -> EpisodeMetadata:
         if lines and lines[-1].strip() == "```":
             lines = lines[:-1]
         text = "\n".join(lines)
+    return text
 
-    data = json.loads(text)
 
+def _metadata_from_dict(data: dict) -> EpisodeMetadata:
     chapters = []
     for ch in data.get("chapters", []):
         chapters.append(
@@ -108,13 +360,9 @@ def _parse_response(raw: str) -> EpisodeMetadata:
 
 def load_transcript(path: Path) -> Transcript:
     """Load a transcript from a JSON file."""
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
-    return Transcript(**data)
+    return Transcript.model_validate_json(Path(path).read_bytes())
 
 
 def save_metadata(metadata: EpisodeMetadata, path: Path) -> None:
     """Save metadata to a JSON file."""
-    Path(path).write_text(
-        metadata.model_dump_json(indent=2),
-        encoding="utf-8",
-    )
+    Path(path).write_bytes(to_json(metadata, indent=2))
@@ -20,11 +20,9 @@ class Transcript(BaseModel):
     full_text: str = ""
 
     def to_timestamped_text(self) -> str:
-        lines = []
-        for seg in self.segments:
-            ts = _format_timestamp(seg.start)
-            lines.append(f"[{ts}] {seg.text}")
-        return "\n".join(lines)
+        return "\n".join([
+            f"[{_format_timestamp(seg.start)}] {seg.text}" for seg in self.segments
+        ])
 
 
 class Chapter(BaseModel):
@@ -63,9 +61,8 @@ class EpisodeInfo(BaseModel):
 
 
 def _format_timestamp(seconds: float) -> str:
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    if h > 0:
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    if h:
         return f"{h:02d}:{m:02d}:{s:02d}"
     return f"{m:02d}:{s:02d}"
@@ -1,14 +1,13 @@
 """Prompt templates for LLM-based metadata generation."""
 
+import functools
+
 SYSTEM_PROMPT = """\
 You are a podcast production assistant. Given a transcript, generate structured \
 metadata for the episode. Be concise, engaging, and SEO-friendly. \
 Always respond with valid JSON matching the requested schema."""
 
-METADATA_PROMPT = """\
-Below is the transcript for a podcast episode. Generate the following metadata \
-as a JSON object:
-
+_METADATA_FIELDS = """\
 1. "title": A catchy, descriptive episode title (max 100 characters). Do NOT \
    include the podcast name or episode number.
 2. "description": A compelling 2-3 sentence episode description for podcast apps.
@@ -17,7 +16,13 @@ as a JSON object:
 4. "tags": A list of {max_tags} relevant tags/keywords for discoverability.
 5. "summary": A one-sentence summary of the episode.
 {chapters_instruction}
+"""
+
+METADATA_PROMPT = """\
+Below is the transcript for a podcast episode. Generate the following metadata \
+as a JSON object:
 
+""" + _METADATA_FIELDS + """
 Respond ONLY with a valid JSON object. No markdown fences, no explanation.
 
 ---
@@ -26,6 +31,18 @@ TRANSCRIPT:
 {transcript}
 """
 
+BATCH_METADATA_PROMPT = """\
+Below are the transcripts for {count} podcast episodes, numbered from 1. For \
+EACH episode, generate the following metadata as a JSON object:
+
+""" + _METADATA_FIELDS + """
+Respond ONLY with a valid JSON object of the form {{"episodes": [...]}} holding \
+one metadata object per transcript, in transcript order. No markdown fences, \
+no explanation.
+
+{transcripts}
+"""
+
 CHAPTERS_INSTRUCTION = """\
 6. "chapters": A list of chapter markers, each with "start_time" (float seconds) \
    and "title" (string). Identify 4-10 major topic transitions. Use the timestamps \
@@ -35,16 +52,44 @@ NO_CHAPTERS_INSTRUCTION = """\
 6. "chapters": Return an empty list []."""
 
 
+@functools.lru_cache(maxsize=8)
+def _prompt_halves(max_tags: int, generate_chapters: bool) -> tuple[str, str]:
+    """The formatted prompt split around the transcript placeholder."""
+    chapters_instruction = (
+        CHAPTERS_INSTRUCTION if generate_chapters else NO_CHAPTERS_INSTRUCTION
+    )
+    prefix, _, suffix = METADATA_PROMPT.format(
+        transcript="{transcript}",
+        max_tags=max_tags,
+        chapters_instruction=chapters_instruction,
+    ).partition("{transcript}")
+    return prefix, suffix
+
+
 def build_metadata_prompt(
     transcript_text: str,
     max_tags: int = 10,
     generate_chapters: bool = True,
+) -> str:
+    prefix, suffix = _prompt_halves(max_tags, generate_chapters)
+    return prefix + transcript_text + suffix
+
+
+def build_batch_metadata_prompt(
+    transcript_texts: list[str],
+    max_tags: int = 10,
+    generate_chapters: bool = True,
 ) -> str:
     chapters_instruction = (
         CHAPTERS_INSTRUCTION if generate_chapters else NO_CHAPTERS_INSTRUCTION
     )
-    return METADATA_PROMPT.format(
-        transcript=transcript_text,
+    transcripts = "\n".join(
+        f"---\nEPISODE {i} TRANSCRIPT:\n\n{text}\n"
+        for i, text in enumerate(transcript_texts, start=1)
+    )
+    return BATCH_METADATA_PROMPT.format(
+        count=len(transcript_texts),
         max_tags=max_tags,
         chapters_instruction=chapters_instruction,
+        transcripts=transcripts,
     )
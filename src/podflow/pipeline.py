@@ -2,31 +2,46 @@
 
 from __future__ import annotations
 
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from podflow.config import PodflowConfig
 from podflow.metadata.models import EpisodeInfo, EpisodeMetadata, Transcript
-from podflow.state import PipelineState, load_state, save_state
+from podflow.state import (
+    PipelineState,
+    flush_state_writes,
+    load_state,
+    save_state,
+    state_file_path,
+)
 from podflow.utils.logging import get_logger
 from podflow.utils.paths import (
     episode_id_from_file,
     episode_output_dir,
-    find_ffprobe,
-    output_audio_path,
-    output_metadata_path,
-    output_transcript_path,
-    output_video_path,
+    episode_path,
 )
 
 log = get_logger(__name__)
 
+# ffmpeg stages are CPU-bound; cap how many run at once across a batch so
+# concurrent episodes overlap their network-bound stages instead.
+_FFMPEG_STAGES = frozenset({"process_audio", "process_video"})
+_ffmpeg_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+
+# The feed file is shared by every episode
+_feed_lock = threading.Lock()
+
 
 def _has_video_stream(input_path: Path) -> bool:
     """Check if the input file contains a video stream."""
     try:
-        import ffmpeg
-        probe = ffmpeg.probe(str(input_path), cmd=find_ffprobe())
+        from podflow.processing.video import probe_video
+        probe = probe_video(input_path)
         return any(
             s["codec_type"] == "video"
             for s in probe.get("streams", [])
@@ -56,7 +71,10 @@ def run_pipeline(
     state = load_state(base_output, episode_id) if resume else PipelineState(episode_id=episode_id)
     state.input_file = str(input_path)
 
-    has_video = _has_video_stream(input_path)
+    # ffprobe runs alongside the audio stage; only the video stages wait on it
+    probe_pool = ThreadPoolExecutor(max_workers=1)
+    has_video = probe_pool.submit(_has_video_stream, input_path)
+    probe_pool.shutdown(wait=False)
 
     episode = EpisodeInfo(
         episode_number=episode_number,
@@ -66,10 +84,10 @@ def run_pipeline(
 
     stages = [
         ("process_audio", lambda: _stage_process_audio(input_path, ep_dir, episode_id, config, episode)),
-        ("process_video", lambda: _stage_process_video(input_path, ep_dir, episode_id, config, episode, has_video)),
+        ("process_video", lambda: _stage_process_video(input_path, ep_dir, episode_id, config, episode, has_video.result())),
         ("transcribe", lambda: _stage_transcribe(ep_dir, episode_id, config, episode)),
         ("generate_metadata", lambda: _stage_generate_metadata(ep_dir, episode_id, config, episode)),
-        ("upload_youtube", lambda: _stage_upload_youtube(ep_dir, episode_id, config, episode, has_video)),
+        ("upload_youtube", lambda: _stage_upload_youtube(ep_dir, episode_id, config, episode, has_video.result())),
         ("host_audio", lambda: _stage_host_audio(ep_dir, episode_id, config, episode)),
         ("update_feed", lambda: _stage_update_feed(config, episode)),
     ]
@@ -79,9 +97,9 @@ def run_pipeline(
         log.info("Input: %s", input_path)
         log.info("Episode ID: %s", episode_id)
         log.info("Output dir: %s", ep_dir)
-        log.info("Has video: %s", has_video)
+        log.info("Has video: %s", has_video.result())
         for stage_name, _ in stages:
-            status = state.get_stage(stage_name).status.value
+            status = state.get_stage(stage_name).status
             skip = "(skip)" if state.is_completed(stage_name) and resume else ""
             log.info("  Stage: %-20s [%s] %s", stage_name, status, skip)
         return episode
@@ -95,23 +113,72 @@ def run_pipeline(
 
         log.info("=== Running stage: %s ===", stage_name)
         state.set_running(stage_name)
-        save_state(state, base_output)
+        if config.output.persist_running_state:
+            # Resume only skips completed stages, so this write just records
+            # which stage a crashed run was in
+            save_state(state, base_output)
 
         try:
-            outputs = stage_fn()
+            with _ffmpeg_slots if stage_name in _FFMPEG_STAGES else nullcontext():
+                outputs = stage_fn()
             state.set_completed(stage_name, outputs or {})
             save_state(state, base_output)
             log.info("Stage %s completed", stage_name)
         except Exception as e:
             state.set_failed(stage_name, str(e))
             save_state(state, base_output)
+            try:
+                flush_state_writes(state_file_path(base_output, episode_id))
+            except Exception:
+                # Don't let a state write error mask the stage failure
+                log.exception("Could not save failed state for %s", episode_id)
             log.error("Stage %s failed: %s", stage_name, e)
             raise
 
+    flush_state_writes(state_file_path(base_output, episode_id))
     log.info("=== Pipeline complete for %s ===", episode_id)
     return episode
 
 
+def run_pipeline_batch(
+    input_paths: list[Path],
+    config: PodflowConfig,
+    max_concurrency: int = 2,
+    resume: bool = False,
+    dry_run: bool = False,
+    privacy: str | None = None,
+) -> list[EpisodeInfo | Exception]:
+    """Run the pipeline for several episodes concurrently.
+
+    Most stages wait on the network (transcription, LLM, uploads), so up to
+    ``max_concurrency`` episodes are in flight at once; ffmpeg stages are
+    additionally limited to half the CPU count. Returns one entry per input,
+    in order: the EpisodeInfo, or the exception that stopped that episode.
+    Inputs naming the same episode are run once and share a result.
+    """
+    def _run_one(input_path: Path) -> EpisodeInfo | Exception:
+        try:
+            return run_pipeline(
+                input_path=input_path,
+                config=config,
+                resume=resume,
+                dry_run=dry_run,
+                privacy=privacy,
+            )
+        except Exception as e:
+            return e
+
+    # The same file given twice would race on one state file and upload twice
+    episode_ids = [episode_id_from_file(path) for path in input_paths]
+    unique: dict[str, Path] = {}
+    for episode_id, path in zip(episode_ids, input_paths):
+        unique.setdefault(episode_id, path)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        by_id = dict(zip(unique, pool.map(_run_one, unique.values())))
+    return [by_id[episode_id] for episode_id in episode_ids]
+
+
 def _restore_from_state(state: PipelineState, stage_name: str, episode: EpisodeInfo) -> None:
     """Restore episode info from saved state outputs."""
     outputs = state.get_stage(stage_name).outputs
@@ -124,14 +191,12 @@ def _restore_from_state(state: PipelineState, stage_name: str, episode: EpisodeI
         episode.transcript_file = outputs["transcript_file"]
         path = Path(outputs["transcript_file"])
         if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            episode.transcript = Transcript(**data)
+            episode.transcript = Transcript.model_validate_json(path.read_bytes())
     elif stage_name == "generate_metadata" and "metadata_file" in outputs:
         episode.metadata_file = outputs["metadata_file"]
         path = Path(outputs["metadata_file"])
         if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            episode.metadata = EpisodeMetadata(**data)
+            episode.metadata = EpisodeMetadata.model_validate_json(path.read_bytes())
     elif stage_name == "upload_youtube":
         episode.youtube_video_id = outputs.get("youtube_video_id")
         episode.youtube_url = outputs.get("youtube_url")
@@ -146,7 +211,7 @@ def _stage_process_audio(
 ) -> dict:
     from podflow.processing.audio import get_audio_duration, process_audio
 
-    out_path = output_audio_path(ep_dir, episode_id)
+    out_path = episode_path(ep_dir, episode_id, "audio")
     process_audio(input_path, out_path, config.audio)
     duration = get_audio_duration(out_path)
 
@@ -166,7 +231,7 @@ def _stage_process_video(
 
     from podflow.processing.video import process_video
 
-    out_path = output_video_path(ep_dir, episode_id)
+    out_path = episode_path(ep_dir, episode_id, "video")
     process_video(input_path, out_path, config.video)
     episode.video_file = str(out_path)
     return {"video_file": str(out_path)}
@@ -189,8 +254,9 @@ def _stage_transcribe(
         transcriber = WhisperAPITranscriber(tc)
 
     transcript = transcriber.transcribe(audio_path)
-    out_path = output_transcript_path(ep_dir, episode_id)
-    out_path.write_text(transcript.model_dump_json(indent=2), encoding="utf-8")
+    out_path = episode_path(ep_dir, episode_id, "transcript")
+    # Serialize straight to UTF-8 bytes; skips the intermediate str copy
+    out_path.write_bytes(to_json(transcript, indent=2))
 
     episode.transcript = transcript
     episode.transcript_file = str(out_path)
@@ -207,7 +273,7 @@ def _stage_generate_metadata(
     from podflow.metadata.generator import generate_metadata, save_metadata
 
     metadata = generate_metadata(episode.transcript, config.metadata)
-    out_path = output_metadata_path(ep_dir, episode_id)
+    out_path = episode_path(ep_dir, episode_id, "metadata")
     save_metadata(metadata, out_path)
 
     episode.metadata = metadata
@@ -268,23 +334,25 @@ def _stage_update_feed(
     from podflow.feed.generator import generate_feed_xml, load_episodes_from_dir
 
     base_output = Path(config.output.base_dir)
-    episodes = load_episodes_from_dir(base_output)
+    feed_path = base_output / config.feed.feed_filename
 
-    # Add the current episode if not already in the list
-    if episode.metadata and episode.audio_url:
-        episodes.append(episode)
+    with _feed_lock:
+        episodes = load_episodes_from_dir(base_output)
 
-    feed_path = base_output / config.feed.feed_filename
-    generate_feed_xml(config.feed, episodes, feed_path)
-
-    # Also host the feed file if using S3 or SCP
-    if config.hosting.method in ("s3", "scp"):
-        from podflow.feed.hosting import upload_audio
-        upload_audio(
-            audio_path=feed_path,
-            config=config.hosting,
-            remote_filename=config.feed.feed_filename,
-        )
+        # Add the current episode if not already in the list
+        if episode.metadata and episode.audio_url:
+            episodes.append(episode)
+
+        generate_feed_xml(config.feed, episodes, feed_path)
+
+        # Also host the feed file if using S3 or SCP
+        if config.hosting.method in ("s3", "scp"):
+            from podflow.feed.hosting import upload_audio
+            upload_audio(
+                audio_path=feed_path,
+                config=config.hosting,
+                remote_filename=config.feed.feed_filename,
+            )
 
     episode.feed_updated = True
     return {"feed_path": str(feed_path)}
@@ -7,8 +7,6 @@ import os
 import subprocess
 from pathlib import Path
 
-import ffmpeg
-
 from podflow.config import AudioConfig
 from podflow.utils.logging import get_logger
 from podflow.utils.paths import find_ffmpeg, find_ffprobe
@@ -18,6 +16,8 @@ log = get_logger(__name__)
 
 def get_audio_duration(input_path: Path) -> float:
     """Get duration of an audio file in seconds."""
+    import ffmpeg
+
     probe = ffmpeg.probe(str(input_path), cmd=find_ffprobe())
     duration = float(probe["format"]["duration"])
     return duration
@@ -55,30 +55,31 @@ def process_audio(
 ) -> Path:
     """Transcode audio to MP3 with loudness normalization.
 
-    Two-pass loudness normalization:
-    1. Measure current loudness
-    2. Apply correction to target LUFS
+    By default loudnorm runs single-pass (dynamic mode), measuring as it
+    encodes. With ``config.two_pass_loudnorm`` a separate measurement pass
+    runs first and its results are fed into a linear correction.
     """
-    input_path = Path(input_path)
-    output_path = Path(output_path)
+    import ffmpeg
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    log.info("Measuring loudness of %s", input_path.name)
-    loudness = measure_loudness(input_path)
-
-    measured_i = loudness.get("input_i", "-24.0")
-    measured_tp = loudness.get("input_tp", "-2.0")
-    measured_lra = loudness.get("input_lra", "7.0")
-    measured_thresh = loudness.get("input_thresh", "-34.0")
-
-    loudnorm_filter = (
-        f"loudnorm=I={config.target_lufs}:TP=-1.5:LRA=11:"
-        f"measured_I={measured_i}:"
-        f"measured_TP={measured_tp}:"
-        f"measured_LRA={measured_lra}:"
-        f"measured_thresh={measured_thresh}:"
-        f"print_format=summary"
-    )
+    loudnorm_filter = f"loudnorm=I={config.target_lufs}:TP=-1.5:LRA=11:"
+    if config.two_pass_loudnorm:
+        log.info("Measuring loudness of %s", input_path.name)
+        loudness = measure_loudness(input_path)
+
+        measured_i = loudness.get("input_i", "-24.0")
+        measured_tp = loudness.get("input_tp", "-2.0")
+        measured_lra = loudness.get("input_lra", "7.0")
+        measured_thresh = loudness.get("input_thresh", "-34.0")
+
+        loudnorm_filter += (
+            f"measured_I={measured_i}:"
+            f"measured_TP={measured_tp}:"
+            f"measured_LRA={measured_lra}:"
+            f"measured_thresh={measured_thresh}:"
+        )
+    loudnorm_filter += "print_format=summary"
 
     log.info(
         "Transcoding %s -> %s (mono %s, %s LUFS)",
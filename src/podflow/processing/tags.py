@@ -4,18 +4,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from mutagen.id3 import (
-    APIC,
-    TALB,
-    TCON,
-    TDRC,
-    TIT2,
-    TPE1,
-    TRCK,
-    COMM,
-)
-from mutagen.mp3 import MP3
-
 from podflow.metadata.models import EpisodeMetadata
 from podflow.utils.logging import get_logger
 
@@ -32,8 +20,19 @@ def apply_id3_tags(
     artwork_path: Path | None = None,
 ) -> None:
     """Apply ID3v2.4 tags to an MP3 file."""
-    mp3_path = Path(mp3_path)
-    audio = MP3(str(mp3_path))
+    from mutagen.id3 import (
+        APIC,
+        TALB,
+        TCON,
+        TDRC,
+        TIT2,
+        TPE1,
+        TRCK,
+        COMM,
+    )
+    from mutagen.mp3 import MP3
+
+    audio = MP3(mp3_path)
 
     # Ensure ID3 tags exist
     if audio.tags is None:
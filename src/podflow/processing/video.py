@@ -2,28 +2,57 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import subprocess
 from pathlib import Path
 
-import ffmpeg
-
 from podflow.config import VideoConfig
 from podflow.utils.logging import get_logger
 from podflow.utils.paths import find_ffmpeg, find_ffprobe
 
 log = get_logger(__name__)
 
+# Hardware H.264 encoders, in the order hw_accel="auto" tries them
+_HW_ENCODERS = {
+    "nvenc": "h264_nvenc",
+    "videotoolbox": "h264_videotoolbox",
+    "qsv": "h264_qsv",
+    "vaapi": "h264_vaapi",
+}
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_probe(path_str: str, mtime_ns: int) -> dict:
+    import ffmpeg
+
+    return ffmpeg.probe(path_str, cmd=find_ffprobe())
+
 
 def probe_video(input_path: Path) -> dict:
-    """Probe a video file for stream information."""
-    return ffmpeg.probe(str(input_path), cmd=find_ffprobe())
+    """Probe a video file for stream information.
+
+    Results are cached per path and modification time, so the pipeline's
+    repeated probes of one input spawn ffprobe only once. Treat the
+    returned dict as read-only.
+    """
+    return _cached_probe(str(input_path), os.stat(input_path).st_mtime_ns)
 
 
-def needs_reencode(input_path: Path, config: VideoConfig) -> bool:
+def needs_reencode(
+    input_path: Path,
+    config: VideoConfig,
+    probe: dict | None = None,
+) -> bool:
     """Check if a video needs re-encoding for YouTube."""
-    try:
-        probe = probe_video(input_path)
-    except ffmpeg.Error:
-        return True
+    import ffmpeg
+
+    if probe is None:
+        try:
+            probe = probe_video(input_path)
+        except (ffmpeg.Error, OSError):
+            return True
 
     video_streams = [
         s for s in probe.get("streams", [])
@@ -44,17 +73,69 @@ def needs_reencode(input_path: Path, config: VideoConfig) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _encoder_works(encoder: str) -> bool:
+    """Trial-encode a few blank frames.
+
+    ``ffmpeg -encoders`` lists encoders the build supports even when the
+    hardware behind them is missing, so only a real encode is conclusive.
+    """
+    cmd = ["-hide_banner", "-loglevel", "error"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vaapi_device", VAAPI_DEVICE]
+    cmd += ["-f", "lavfi", "-i", "nullsrc=s=256x256:d=0.1"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vf", "format=nv12,hwupload"]
+    cmd += ["-c:v", encoder, "-f", "null", "-"]
+    try:
+        result = subprocess.run(
+            [find_ffmpeg(), *cmd],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+def detect_hw_encoder(hw_accel: str) -> str | None:
+    """Resolve a ``hw_accel`` setting to a usable backend name, or None."""
+    if hw_accel == "none":
+        return None
+    candidates = list(_HW_ENCODERS) if hw_accel == "auto" else [hw_accel]
+    for name in candidates:
+        if _encoder_works(_HW_ENCODERS[name]):
+            return name
+    log.warning("No working hardware encoder for hw_accel=%s, using software", hw_accel)
+    return None
+
+
+def _hw_output_kwargs(backend: str, crf: int) -> dict:
+    """Encoder and rate-control options approximating ``crf`` on ``backend``."""
+    kwargs: dict = {"vcodec": _HW_ENCODERS[backend]}
+    if backend == "nvenc":
+        kwargs.update(rc="vbr", cq=crf, pix_fmt="yuv420p")
+    elif backend == "qsv":
+        kwargs.update(global_quality=crf, pix_fmt="nv12")
+    elif backend == "videotoolbox":
+        # -q:v runs 1-100, higher is better; map crf 0-51 onto it linearly
+        kwargs.update({"q:v": round(100 - crf * 99 / 51), "pix_fmt": "yuv420p"})
+    elif backend == "vaapi":
+        kwargs.update(qp=crf)
+    return kwargs
+
+
 def process_video(
     input_path: Path,
     output_path: Path,
     config: VideoConfig,
+    probe: dict | None = None,
 ) -> Path:
     """Re-encode video for YouTube compatibility (H.264 + AAC)."""
-    input_path = Path(input_path)
-    output_path = Path(output_path)
+    import ffmpeg
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if not needs_reencode(input_path, config):
+    if not needs_reencode(input_path, config, probe):
         log.info("Video already compatible, copying: %s", input_path.name)
         stream = (
             ffmpeg
@@ -65,26 +146,34 @@ def process_video(
         stream.run(cmd=find_ffmpeg(), quiet=True)
         return output_path
 
+    backend = detect_hw_encoder(config.hw_accel)
     log.info(
         "Re-encoding video %s -> %s (H.264 crf=%d, %s)",
-        input_path.name, output_path.name, config.crf, config.preset,
+        input_path.name, output_path.name, config.crf,
+        _HW_ENCODERS[backend] if backend else config.preset,
     )
 
-    probe = probe_video(input_path)
+    if probe is None:
+        probe = probe_video(input_path)
     video_streams = [
         s for s in probe.get("streams", [])
         if s["codec_type"] == "video"
     ]
 
-    output_kwargs = {
-        "vcodec": config.codec,
-        "preset": config.preset,
-        "crf": config.crf,
-        "acodec": config.audio_codec,
-        "audio_bitrate": config.audio_bitrate,
-        "movflags": "+faststart",
-        "pix_fmt": "yuv420p",
-    }
+    if backend:
+        output_kwargs = _hw_output_kwargs(backend, config.crf)
+    else:
+        output_kwargs = {
+            "vcodec": config.codec,
+            "preset": config.preset,
+            "crf": config.crf,
+            "pix_fmt": "yuv420p",
+        }
+    output_kwargs.update(
+        acodec=config.audio_codec,
+        audio_bitrate=config.audio_bitrate,
+        movflags="+faststart",
+    )
 
     # Scale down if needed while preserving aspect ratio
     if video_streams:
@@ -97,13 +186,20 @@ def process_video(
                 f"pad=ceil(iw/2)*2:ceil(ih/2)*2"
             )
 
+    input_kwargs = {}
+    if backend == "vaapi":
+        # Frames are filtered in software, then uploaded to the GPU surface
+        input_kwargs["vaapi_device"] = VAAPI_DEVICE
+        vf = output_kwargs.get("vf")
+        output_kwargs["vf"] = f"{vf},format=nv12,hwupload" if vf else "format=nv12,hwupload"
+
     stream = (
         ffmpeg
-        .input(str(input_path))
+        .input(str(input_path), **input_kwargs)
         .output(str(output_path), **output_kwargs)
         .overwrite_output()
     )
-    stream.run(quiet=True)
+    stream.run(cmd=find_ffmpeg(), quiet=True)
 
     log.info("Video processing complete: %s", output_path.name)
     return output_path
@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
-import json
-from enum import Enum
+import atexit
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic_core import to_json
 
+from podflow.utils.logging import get_logger
+from podflow.utils.paths import atomic_write_bytes
 
-class StageStatus(str, Enum):
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+log = get_logger(__name__)
+
+
+Status = Literal["pending", "running", "completed", "failed", "skipped"]
+
+
+class StageStatus:
+    """Names for the stage status strings."""
+    PENDING: Status = "pending"
+    RUNNING: Status = "running"
+    COMPLETED: Status = "completed"
+    FAILED: Status = "failed"
+    SKIPPED: Status = "skipped"
 
 
 class StageState(BaseModel):
-    status: StageStatus = StageStatus.PENDING
+    status: Status = StageStatus.PENDING
     error: str | None = None
     outputs: dict[str, Any] = Field(default_factory=dict)
 
@@ -39,6 +49,8 @@ class PipelineState(BaseModel):
     episode_id: str = ""
     input_file: str = ""
     stages: dict[str, StageState] = Field(default_factory=dict)
+    # Serialized form as of the last save_state, to skip no-op rewrites
+    _saved: bytes | None = PrivateAttr(default=None)
 
     def model_post_init(self, __context: Any) -> None:
         for stage in PIPELINE_STAGES:
@@ -78,22 +90,111 @@ class PipelineState(BaseModel):
         return None
 
 
+class _StateWriter:
+    """Writes state files on a background thread.
+
+    Only the newest pending snapshot per file is kept, so rapid transitions
+    coalesce into one write. A failed write is re-raised from the next flush
+    of that file (or of every file).
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Path, bytes] = {}
+        self._writing: Path | None = None
+        self._errors: dict[Path, Exception] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, path: Path, data: bytes) -> None:
+        with self._cond:
+            self._pending[path] = data
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def _ensure_thread(self) -> None:
+        # Called with the lock held; also revives a thread that has died
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="podflow-state-writer", daemon=True,
+            )
+            self._thread.start()
+
+    def flush(self, path: Path | None = None, raise_errors: bool = True) -> None:
+        """Wait until ``path`` (or every file) has been written.
+
+        With ``raise_errors=False`` failed writes are left for their own
+        file's flush to report.
+        """
+        def done() -> bool:
+            if path is None:
+                return not self._pending and self._writing is None
+            return path not in self._pending and self._writing != path
+
+        with self._cond:
+            if self._pending:
+                self._ensure_thread()
+            self._cond.wait_for(done)
+            if not raise_errors:
+                return
+            if path is None:
+                errors = list(self._errors.values())
+                self._errors.clear()
+            else:
+                errors = [self._errors.pop(path)] if path in self._errors else []
+        if errors:
+            raise errors[0]
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                path = next(iter(self._pending))
+                data = self._pending.pop(path)
+                self._writing = path
+            try:
+                atomic_write_bytes(path, data)
+            except Exception as e:
+                log.error("Could not write state file %s: %s", path, e)
+                with self._cond:
+                    self._errors[path] = e
+            finally:
+                with self._cond:
+                    self._writing = None
+                    self._cond.notify_all()
+
+
+_writer = _StateWriter()
+
+
+def flush_state_writes(path: Path | None = None, raise_errors: bool = True) -> None:
+    """Block until the queued state file at ``path`` (default: all) is on disk."""
+    _writer.flush(path, raise_errors)
+
+
+atexit.register(_writer.flush)
+
+
 def state_file_path(output_dir: Path, episode_id: str) -> Path:
     return output_dir / f".podflow_state_{episode_id}.json"
 
 
 def load_state(output_dir: Path, episode_id: str) -> PipelineState:
     path = state_file_path(output_dir, episode_id)
+    _writer.flush(path)
     if path.exists():
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return PipelineState(**data)
+        return PipelineState.model_validate_json(path.read_bytes())
     return PipelineState(episode_id=episode_id)
 
 
 def save_state(state: PipelineState, output_dir: Path) -> None:
-    path = state_file_path(output_dir, state.episode_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        state.model_dump_json(indent=2),
-        encoding="utf-8",
-    )
+    """Queue the state for writing, unless nothing changed since the last save.
+
+    The file is written atomically on a background thread; call
+    flush_state_writes() before relying on it being on disk.
+    """
+    # Compact JSON: the state file is rewritten on every stage transition
+    data = to_json(state)
+    if data == state._saved:
+        return
+    _writer.submit(state_file_path(output_dir, state.episode_id), data)
+    state._saved = data
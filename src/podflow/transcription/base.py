@@ -16,6 +16,13 @@ class Transcriber(ABC):
         """Transcribe an audio file and return a Transcript."""
         ...
 
+    def transcribe_batch(self, audio_paths: list[Path]) -> list[Transcript]:
+        """Transcribe several files, in order.
+
+        Backends that can share work across files override this.
+        """
+        return [self.transcribe(path) for path in audio_paths]
+
     @property
     @abstractmethod
     def name(self) -> str:
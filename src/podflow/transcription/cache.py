@@ -0,0 +1,61 @@
+"""On-disk cache of transcripts, keyed by audio content and settings."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from pydantic_core import to_json
+
+from podflow.config import TranscriptionConfig
+from podflow.metadata.models import Transcript
+from podflow.utils.logging import get_logger
+from podflow.utils.paths import atomic_write_bytes, user_cache_dir
+
+log = get_logger(__name__)
+
+
+def cache_path(audio_path: Path, config: TranscriptionConfig) -> Path | None:
+    """Cache entry for transcribing this audio with these settings.
+
+    Keyed on the audio bytes rather than its mtime: the pipeline re-encodes
+    the audio on every run, so the mtime changes even when the bytes don't.
+    """
+    if not config.cache_enabled:
+        return None
+    with open(audio_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            h = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+        else:
+            h = hashlib.blake2b(digest_size=16)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+    h.update(
+        f"|{config.backend}|{config.model}|{config.language}|{config.prompt}|{config.vad}".encode("utf-8")
+    )
+    base = Path(config.cache_dir) if config.cache_dir else user_cache_dir("transcripts")
+    return base / f"{h.hexdigest()}.json"
+
+
+def read_cached(path: Path | None) -> Transcript | None:
+    if path is None:
+        return None
+    try:
+        if not path.exists():
+            return None
+        transcript = Transcript.model_validate_json(path.read_bytes())
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring unreadable transcript cache entry %s: %s", path.name, e)
+        return None
+    log.info("Using cached transcript (%s)", path.name)
+    return transcript
+
+
+def write_cached(path: Path | None, transcript: Transcript) -> None:
+    """Store a transcript; a cache that can't be written is only a warning."""
+    if path is None:
+        return
+    try:
+        atomic_write_bytes(path, to_json(transcript))
+    except OSError as e:
+        log.warning("Could not write transcript cache entry %s: %s", path.name, e)
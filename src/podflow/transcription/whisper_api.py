@@ -2,36 +2,45 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 import openai
 
 from podflow.config import TranscriptionConfig, get_api_key
 from podflow.metadata.models import Transcript, TranscriptSegment
+from podflow.transcription import cache
 from podflow.transcription.base import Transcriber
 from podflow.utils.logging import get_logger
 
 log = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_client(api_key: str) -> openai.OpenAI:
+    """One client per key for the process, so transcribers share its connection pool."""
+    return openai.OpenAI(api_key=api_key)
+
+
 class WhisperAPITranscriber(Transcriber):
     """Transcribe using the OpenAI Whisper API."""
 
     def __init__(self, config: TranscriptionConfig) -> None:
         self.config = config
-        self._client: openai.OpenAI | None = None
 
     @property
     def name(self) -> str:
         return "whisper-api"
 
     def _get_client(self) -> openai.OpenAI:
-        if self._client is None:
-            api_key = get_api_key("OPENAI_API_KEY")
-            self._client = openai.OpenAI(api_key=api_key)
-        return self._client
+        return _shared_client(get_api_key("OPENAI_API_KEY"))
 
     def transcribe(self, audio_path: Path) -> Transcript:
+        cache_path = cache.cache_path(audio_path, self.config)
+        transcript = cache.read_cached(cache_path)
+        if transcript is not None:
+            return transcript
+
         client = self._get_client()
         log.info("Transcribing %s via Whisper API", audio_path.name)
 
@@ -49,27 +58,26 @@ class WhisperAPITranscriber(Transcriber):
             kwargs["file"] = f
             response = client.audio.transcriptions.create(**kwargs)
 
-        segments = []
-        for seg in getattr(response, "segments", []) or []:
-            segments.append(
-                TranscriptSegment(
-                    start=seg["start"],
-                    end=seg["end"],
-                    text=seg["text"].strip(),
-                )
-            )
-
-        full_text = getattr(response, "text", "") or ""
+        # Current SDKs return typed segment objects, early 1.x releases dicts
+        segments = [
+            TranscriptSegment(start=seg.start, end=seg.end, text=seg.text.strip())
+            if not isinstance(seg, dict) else
+            TranscriptSegment(start=seg["start"], end=seg["end"], text=seg["text"].strip())
+            for seg in getattr(response, "segments", None) or ()
+        ]
+
+        full_text = (getattr(response, "text", None) or "").strip()
         language = getattr(response, "language", self.config.language or "en")
 
         transcript = Transcript(
             segments=segments,
             language=language,
-            full_text=full_text.strip(),
+            full_text=full_text,
         )
 
         log.info(
             "Transcription complete: %d segments, %d characters",
             len(segments), len(full_text),
         )
+        cache.write_cached(cache_path, transcript)
         return transcript
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
 
 from google.auth.transport.requests import Request
@@ -10,6 +12,7 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 from podflow.utils.logging import get_logger
+from podflow.utils.paths import atomic_write_bytes
 
 log = get_logger(__name__)
 
@@ -28,12 +31,13 @@ def get_authenticated_credentials(
     creds = None
 
     # Try to load cached token
-    if token_path.exists():
-        try:
-            creds = Credentials.from_authorized_user_file(str(token_path), scopes)
-        except (json.JSONDecodeError, ValueError) as e:
-            log.warning("Cached token invalid, re-authenticating: %s", e)
-            creds = None
+    try:
+        creds = _load_token(str(token_path), os.stat(token_path).st_mtime_ns, tuple(scopes))
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, ValueError) as e:
+        log.warning("Cached token invalid, re-authenticating: %s", e)
+        creds = None
 
     # Refresh or re-authenticate
     if creds and creds.expired and creds.refresh_token:
@@ -50,9 +54,18 @@ def get_authenticated_credentials(
         log.info("Starting OAuth2 authorization flow (browser will open)")
         flow = InstalledAppFlow.from_client_secrets_file(str(secrets_path), scopes)
         creds = flow.run_local_server(port=0)
+    else:
+        # Still valid as loaded; nothing new to save
+        return creds
 
     # Cache the token
-    token_path.write_text(creds.to_json(), encoding="utf-8")
+    atomic_write_bytes(token_path, creds.to_json().encode("utf-8"))
     log.info("OAuth2 credentials saved to %s", token_path)
 
     return creds
+
+
+@functools.lru_cache(maxsize=4)
+def _load_token(path: str, mtime_ns: int, scopes: tuple[str, ...]) -> Credentials:
+    """Parse a token file once per modification time."""
+    return Credentials.from_authorized_user_file(path, list(scopes))
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import logging
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaIoBaseUpload
 
 from podflow.config import YouTubeConfig
 from podflow.metadata.models import EpisodeMetadata
@@ -18,8 +23,20 @@ from podflow.utils.logging import get_logger
 log = get_logger(__name__)
 
 MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+# Read buffer for the video file; the HTTP layer pulls it in small blocks
+UPLOAD_BUFFER_SIZE = 4 * 1024 * 1024
 RETRIABLE_STATUS_CODES = [500, 502, 503, 504]
 
+# Log upload progress at most once per this many percent
+PROGRESS_LOG_STEP = 10
+
+MAX_TITLE_CHARS = 100
+MAX_DESCRIPTION_CHARS = 5000
+MAX_TAGS = 15
+MAX_TAGS_BYTES = 500
+
 
 def upload_to_youtube(
     video_path: Path,
@@ -40,30 +57,14 @@ def upload_to_youtube(
         client_secrets_file=config.client_secrets_file,
         token_file=config.token_file,
     )
-    youtube = build("youtube", "v3", credentials=creds)
+    youtube = _youtube_client(creds, threading.get_ident())
 
     title = metadata.title
     if episode_number:
         title = f"Ep. {episode_number} — {title}"
-    # YouTube title max is 100 characters
-    title = title[:100]
-
-    description = metadata.description
-    if metadata.show_notes:
-        description += f"\n\n{metadata.show_notes}"
-
-    # Add chapter markers if available
-    if metadata.chapters:
-        description += "\n\nChapters:\n"
-        for ch in metadata.chapters:
-            m = int(ch.start_time // 60)
-            s = int(ch.start_time % 60)
-            description += f"{m:02d}:{s:02d} {ch.title}\n"
-
-    # YouTube description max is 5000 characters
-    description = description[:5000]
-
-    tags = metadata.tags[:15]  # YouTube max 500 chars total for tags
+    title = title[:MAX_TITLE_CHARS]
+    description = _build_description(metadata)
+    tags = _fit_tags(metadata.tags)
 
     body = {
         "snippet": {
@@ -78,62 +79,142 @@ def upload_to_youtube(
         },
     }
 
-    media = MediaFileUpload(
-        str(video_path),
-        mimetype="video/*",
-        resumable=True,
-        chunksize=10 * 1024 * 1024,  # 10MB chunks
-    )
+    with open(video_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as fh:
+        media = MediaIoBaseUpload(
+            fh,
+            mimetype="video/*",
+            resumable=True,
+            # One streaming request; on error next_chunk resumes from the last
+            # byte the server acknowledged rather than starting over
+            chunksize=-1,
+        )
+
+        request = youtube.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+        )
+
+        log.info("Starting YouTube upload: %s (%s)", title, video_path.name)
+        video_id = _resumable_upload(request)
+    log.info("Upload complete — YouTube video ID: %s", video_id)
+    return video_id
+
 
-    request = youtube.videos().insert(
-        part="snippet,status",
-        body=body,
-        media_body=media,
+def upload_many(
+    jobs: list[tuple[Path, EpisodeMetadata]],
+    config: YouTubeConfig,
+    privacy: str | None = None,
+    concurrency: int = 3,
+) -> list[str | Exception]:
+    """Upload several videos, up to ``concurrency`` at a time.
+
+    Returns one entry per job, in order: the YouTube video ID, or the
+    exception that stopped that upload.
+    """
+    # Authenticate once up front so workers don't each start an OAuth flow
+    get_authenticated_credentials(
+        client_secrets_file=config.client_secrets_file,
+        token_file=config.token_file,
     )
 
-    log.info("Starting YouTube upload: %s (%s)", title, video_path.name)
-    video_id = _resumable_upload(request)
-    log.info("Upload complete — YouTube video ID: %s", video_id)
-    return video_id
+    def _upload_one(job: tuple[Path, EpisodeMetadata]) -> str | Exception:
+        video_path, metadata = job
+        try:
+            return upload_to_youtube(video_path, metadata, config, privacy=privacy)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return list(pool.map(_upload_one, jobs))
+
+
+@functools.lru_cache(maxsize=8)
+def _youtube_client(creds: Credentials, thread_id: int):
+    """Build the YouTube API client once per credentials object and thread.
+
+    ``get_authenticated_credentials`` returns the same object until the
+    token file changes, and refreshes it in place, so the client stays valid.
+    The client's httplib2 transport is not thread-safe, hence ``thread_id``.
+    """
+    # The discovery document ships with googleapiclient; skip the file cache
+    return build("youtube", "v3", credentials=creds, cache_discovery=False)
+
+
+def _build_description(metadata: EpisodeMetadata) -> str:
+    """Description, show notes and chapter markers, cut to YouTube's limit."""
+    parts = [metadata.description]
+    if metadata.show_notes:
+        parts.append(metadata.show_notes)
+    if metadata.chapters:
+        parts.append("Chapters:\n" + "".join([
+            "{:02d}:{:02d} {}\n".format(*divmod(int(ch.start_time), 60), ch.title)
+            for ch in metadata.chapters
+        ]))
+    return "\n\n".join(parts)[:MAX_DESCRIPTION_CHARS]
+
+
+def _fit_tags(tags: list[str]) -> list[str]:
+    """Leading tags that fit YouTube's limits on count and combined length.
+
+    The 500-byte budget counts a separator between tags, and quotes
+    around tags that contain spaces.
+    """
+    fitted = []
+    used = 0
+    for tag in tags[:MAX_TAGS]:
+        cost = len(tag.encode("utf-8")) + (2 if " " in tag else 0) + (1 if fitted else 0)
+        if used + cost > MAX_TAGS_BYTES:
+            break
+        fitted.append(tag)
+        used += cost
+    return fitted
+
+
+def _sleep_backoff(prev: float, cap: float = BACKOFF_CAP) -> float:
+    """Next retry delay using decorrelated jitter: uniform(base, 3 * prev), capped.
+
+    Spreads concurrent uploads' retries apart instead of having them all
+    wake on the same 2**n schedule.
+    """
+    return min(cap, random.uniform(BACKOFF_BASE, prev * 3))
 
 
 def _resumable_upload(request) -> str:
-    """Execute a resumable upload with exponential backoff."""
+    """Execute a resumable upload, retrying transient errors with backoff."""
     response = None
     retry = 0
+    delay = BACKOFF_BASE
+    last_pct = -PROGRESS_LOG_STEP
 
     while response is None:
         try:
             status, response = request.next_chunk()
-            if status:
+            if status and log.isEnabledFor(logging.INFO):
                 pct = int(status.progress() * 100)
-                log.info("Upload progress: %d%%", pct)
-        except HttpError as e:
-            if e.resp.status in RETRIABLE_STATUS_CODES:
-                retry += 1
-                if retry > MAX_RETRIES:
-                    raise RuntimeError(
-                        f"YouTube upload failed after {MAX_RETRIES} retries"
-                    ) from e
-                wait = (2 ** retry) + random.random()
-                log.warning(
-                    "Retriable error %d, retrying in %.1fs (attempt %d/%d)",
-                    e.resp.status, wait, retry, MAX_RETRIES,
-                )
-                time.sleep(wait)
+                if pct - last_pct >= PROGRESS_LOG_STEP:
+                    log.info("Upload progress: %d%%", pct)
+                    last_pct = pct
+            # Progress was made, so earlier blips don't count against us
+            retry = 0
+            delay = BACKOFF_BASE
+        except (HttpError, ConnectionError, TimeoutError) as e:
+            if isinstance(e, HttpError):
+                if e.resp.status not in RETRIABLE_STATUS_CODES:
+                    raise
+                reason = f"HTTP {e.resp.status}"
             else:
-                raise
-        except ConnectionError:
+                reason = type(e).__name__
             retry += 1
             if retry > MAX_RETRIES:
                 raise RuntimeError(
-                    f"YouTube upload failed after {MAX_RETRIES} retries (connection error)"
-                )
-            wait = (2 ** retry) + random.random()
+                    f"YouTube upload failed after {MAX_RETRIES} retries ({reason})"
+                ) from e
+            delay = _sleep_backoff(delay)
             log.warning(
-                "Connection error, retrying in %.1fs (attempt %d/%d)",
-                wait, retry, MAX_RETRIES,
+                "Retriable error (%s), retrying in %.1fs (attempt %d/%d)",
+                reason, delay, retry, MAX_RETRIES,
             )
-            time.sleep(wait)
+            time.sleep(delay)
 
     return response["id"]
@@ -23,19 +23,28 @@ def setup_logging(verbose: bool = False) -> None:
     if _configured:
         return
 
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
-                console=console,
-                rich_tracebacks=True,
-                show_path=verbose,
-            )
-        ],
-    )
+    if verbose:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(message)s",
+            datefmt="[%X]",
+            handlers=[
+                RichHandler(
+                    console=console,
+                    rich_tracebacks=True,
+                    show_path=True,
+                    markup=False,
+                )
+            ],
+        )
+    else:
+        # Plain handler: Rich's per-record layout is costly for chatty logs
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+            datefmt="%X",
+            handlers=[logging.StreamHandler()],
+        )
     _configured = True
 
 
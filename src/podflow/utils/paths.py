@@ -2,26 +2,23 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import glob as _glob
 import hashlib
 import os
-import re
 import shutil
+import tempfile
 from pathlib import Path
-
-_ffmpeg_path: str | None = None
+from typing import Literal
 
 
+@functools.cache
 def find_ffmpeg() -> str:
     """Find the ffmpeg executable, checking PATH and common install locations."""
-    global _ffmpeg_path
-    if _ffmpeg_path is not None:
-        return _ffmpeg_path
-
     # Check PATH first
     found = shutil.which("ffmpeg")
     if found:
-        _ffmpeg_path = found
         return found
 
     # Check common winget install location on Windows
@@ -31,7 +28,6 @@ def find_ffmpeg() -> str:
         )
         matches = _glob.glob(winget_pattern)
         if matches:
-            _ffmpeg_path = matches[0]
             return matches[0]
 
     raise FileNotFoundError(
@@ -39,6 +35,7 @@ def find_ffmpeg() -> str:
     )
 
 
+@functools.cache
 def find_ffprobe() -> str:
     """Find the ffprobe executable next to ffmpeg."""
     ffmpeg = find_ffmpeg()
@@ -52,19 +49,41 @@ def find_ffprobe() -> str:
     raise FileNotFoundError("ffprobe not found")
 
 
+_UNSAFE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+
+# Pure function of a short string; repeat inputs become a dict lookup
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
     """Remove or replace characters that are unsafe for filenames."""
-    name = re.sub(r'[<>:"/\\|?*]', "_", name)
-    name = re.sub(r"\s+", "_", name)
+    # Unsafe characters become "_" one for one; whitespace runs collapse to one "_"
+    name = "_".join(name.translate(_UNSAFE_TABLE).split())
     name = name.strip("._")
     return name[:200]
 
 
-def episode_id_from_file(input_file: Path) -> str:
+def sanitize_filenames(names: list[str]) -> list[str]:
+    """Sanitize many names at once, same result as sanitize_filename on each."""
+    # One translate over a NUL-joined buffer instead of one call per name
+    parts = "\x00".join(names).translate(_UNSAFE_TABLE).split("\x00")
+    if len(parts) != len(names):  # a name contained the separator
+        return [sanitize_filename(name) for name in names]
+    return ["_".join(part.split()).strip("._")[:200] for part in parts]
+
+
+def episode_id_from_file(input_file: str | os.PathLike[str]) -> str:
     """Generate a stable episode ID from the input filename."""
-    stem = input_file.stem
+    path = Path(input_file)
+    # Resolve on every call: a relative path means something else after a chdir.
+    # realpath is what Path.resolve() wraps, minus a re-parse and an extra stat.
+    return _episode_id(path.stem, os.path.realpath(path))
+
+
+@functools.lru_cache(maxsize=2048)
+def _episode_id(stem: str, resolved: str) -> str:
     safe = sanitize_filename(stem)
-    short_hash = hashlib.sha256(str(input_file.resolve()).encode()).hexdigest()[:8]
+    # surrogateescape round-trips POSIX names that aren't valid UTF-8
+    short_hash = hashlib.sha256(resolved.encode("utf-8", "surrogateescape")).hexdigest()[:8]
     return f"{safe}_{short_hash}"
 
 
@@ -75,17 +94,55 @@ def episode_output_dir(base_output_dir: Path, episode_id: str) -> Path:
     return out
 
 
+# File name suffix of each per-episode artifact, after the episode ID
+_SUFFIXES = {
+    "audio": ".mp3",
+    "video": ".mp4",
+    "transcript": "_transcript.json",
+    "metadata": "_metadata.json",
+}
+
+
+def episode_path(
+    episode_dir: Path,
+    episode_id: str,
+    kind: Literal["audio", "video", "transcript", "metadata"],
+) -> Path:
+    """Path of one of an episode's output files."""
+    return episode_dir / f"{episode_id}{_SUFFIXES[kind]}"
+
+
 def output_audio_path(episode_dir: Path, episode_id: str) -> Path:
-    return episode_dir / f"{episode_id}.mp3"
+    return episode_path(episode_dir, episode_id, "audio")
 
 
 def output_video_path(episode_dir: Path, episode_id: str) -> Path:
-    return episode_dir / f"{episode_id}.mp4"
+    return episode_path(episode_dir, episode_id, "video")
 
 
 def output_transcript_path(episode_dir: Path, episode_id: str) -> Path:
-    return episode_dir / f"{episode_id}_transcript.json"
+    return episode_path(episode_dir, episode_id, "transcript")
 
 
 def output_metadata_path(episode_dir: Path, episode_id: str) -> Path:
-    return episode_dir / f"{episode_id}_metadata.json"
+    return episode_path(episode_dir, episode_id, "metadata")
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """Per-user cache directory for podflow ($XDG_CACHE_HOME/podflow/...)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base, "podflow", *parts)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file via temp file + rename so readers never see a partial write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
@@ -2,40 +2,43 @@
 
 from __future__ import annotations
 
+# "00".."99"; indexing is much cheaper than a :02d format spec
+_D2 = [f"{i:02d}" for i in range(100)]
+
 
 def seconds_to_hms(seconds: float) -> str:
     """Convert seconds to HH:MM:SS format."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    return f"{h:02d}:{m:02d}:{s:02d}"
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{_D2[h] if 0 <= h < 100 else h}:{_D2[m]}:{_D2[s]}"
 
 
 def seconds_to_ms(seconds: float) -> str:
     """Convert seconds to MM:SS format."""
-    m = int(seconds // 60)
-    s = int(seconds % 60)
-    return f"{m:02d}:{s:02d}"
+    m, s = divmod(int(seconds), 60)
+    return f"{_D2[m] if 0 <= m < 100 else m}:{_D2[s]}"
 
 
 def hms_to_seconds(hms: str) -> float:
     """Convert HH:MM:SS or MM:SS to seconds."""
     parts = hms.split(":")
-    if len(parts) == 3:
-        return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-    if len(parts) == 2:
-        return int(parts[0]) * 60 + float(parts[1])
-    return float(parts[0])
+    n = len(parts)
+    if n == 3:
+        return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
+    if n == 2:
+        return float(parts[0]) * 60 + float(parts[1])
+    if n == 1:
+        return float(parts[0])
+    raise ValueError(f"Invalid timestamp: {hms!r}")
 
 
 def format_duration_human(seconds: float) -> str:
     """Format duration in a human-readable way."""
+    seconds = int(seconds)
     if seconds < 60:
-        return f"{int(seconds)}s"
-    if seconds < 3600:
-        m = int(seconds // 60)
-        s = int(seconds % 60)
+        return f"{seconds}s"
+    m, s = divmod(seconds, 60)
+    if m < 60:
         return f"{m}m {s}s"
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
+    h, m = divmod(m, 60)
     return f"{h}h {m}m"
@@ -1,12 +1,14 @@
 """Tests for the CLI commands."""
 
+import sys
 import tempfile
 from pathlib import Path
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
-from podflow.cli import cli
+from podflow.cli import _resolve_existing, cli
 
 
 def test_version():
@@ -36,3 +38,54 @@ def test_validate_feed_missing():
     result = runner.invoke(cli, ["validate-feed", "/nonexistent/feed.xml"])
     # Should fail because the file doesn't exist
     assert result.exit_code != 0
+
+
+def test_run_missing_input_file():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["run", "/nonexistent/episode.wav"])
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+
+
+def test_run_batch_dry_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.wav").write_bytes(b"")
+    (tmp_path / "b.wav").write_bytes(b"")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["run", "--dry-run", "-j", "2", "a.wav", "b.wav"])
+    assert result.exit_code == 0, result.output
+
+
+def test_run_batch_rejects_episode_number(tmp_path):
+    (tmp_path / "a.wav").write_bytes(b"")
+    (tmp_path / "b.wav").write_bytes(b"")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["run", "-n", "3", str(tmp_path / "a.wav"), str(tmp_path / "b.wav")],
+    )
+    assert result.exit_code == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+def test_resolve_existing_keeps_symlink_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "real_take3.mp4").write_bytes(b"")
+    (tmp_path / "Episode 12.mp4").symlink_to(tmp_path / "real_take3.mp4")
+
+    path = _resolve_existing(None, None, "Episode 12.mp4")
+    assert path == tmp_path / "Episode 12.mp4"
+    assert path.is_absolute()
+
+
+def test_run_batch_runs_duplicate_inputs_once(tmp_path, monkeypatch, mocker):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.wav").write_bytes(b"")
+    (tmp_path / "b.wav").write_bytes(b"")
+    run_pipeline = mocker.patch("podflow.pipeline.run_pipeline")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["run", "--dry-run", "a.wav", "./a.wav", "b.wav"])
+    assert result.exit_code == 0, result.output
+    assert sorted(c.kwargs["input_path"].name for c in run_pipeline.call_args_list) == ["a.wav", "b.wav"]
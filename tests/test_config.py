@@ -56,3 +56,40 @@ def test_load_config_empty_yaml():
 
     os.unlink(f.name)
     assert config == PodflowConfig()
+
+
+def test_load_config_cached_until_file_changes(tmp_path):
+    path = tmp_path / "podcast_config.yaml"
+    path.write_text(yaml.dump({"audio": {"bitrate": "96k"}}), encoding="utf-8")
+
+    first = load_config(path)
+    assert load_config(path) is first
+
+    path.write_text(yaml.dump({"audio": {"bitrate": "256k"}}), encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert load_config(path).audio.bitrate == "256k"
+
+
+def test_load_config_missing_file_returns_shared_defaults():
+    assert load_config("/nonexistent/a.yaml") is load_config("/nonexistent/b.yaml")
+
+
+def test_find_config_file_in_parent_dir(tmp_path, monkeypatch):
+    from podflow.config import find_config_file
+
+    (tmp_path / "podcast_config.yaml").write_text("", encoding="utf-8")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+
+    assert find_config_file().resolve() == (tmp_path / "podcast_config.yaml").resolve()
+
+
+def test_cache_clear_sees_new_config_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    load_config.cache_clear()
+    assert load_config().audio.bitrate == "128k"
+
+    (tmp_path / "podcast_config.yaml").write_text("audio:\n  bitrate: 96k\n", encoding="utf-8")
+    load_config.cache_clear()
+    assert load_config().audio.bitrate == "96k"
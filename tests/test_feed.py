@@ -4,10 +4,12 @@ import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
-from podflow.config import FeedConfig
-from podflow.feed.generator import create_feed, generate_feed_xml
+from podflow.config import FeedConfig, HostingConfig
+from podflow.feed.generator import create_feed, generate_feed_xml, load_episodes_from_dir
+from podflow.feed.hosting import upload_audio
 from podflow.feed.validator import validate_feed
 from podflow.metadata.models import EpisodeInfo, EpisodeMetadata
+from podflow.state import PipelineState, save_state
 
 
 def _make_episode(num: int) -> EpisodeInfo:
@@ -59,6 +61,33 @@ def test_generate_feed_xml():
         assert "https://cdn.example.com/episodes/ep1.mp3" in content
 
 
+def test_generate_feed_xml_matches_feedgen():
+    config = FeedConfig(
+        title="Test Podcast",
+        author="Tester",
+        email="test@example.com",
+        image_url="https://example.com/art.jpg",
+    )
+    episodes = [_make_episode(1), _make_episode(3), _make_episode(2)]
+    episodes[0].metadata.show_notes = "<b>Notes</b>"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lxml_path = generate_feed_xml(config, list(episodes), Path(tmpdir) / "a.xml")
+        fg_path = generate_feed_xml(
+            config, list(episodes), Path(tmpdir) / "b.xml", use_feedgen=True,
+        )
+
+        def _strip_build_date(text: str) -> str:
+            return "\n".join(
+                line for line in text.splitlines() if "<lastBuildDate>" not in line
+            )
+
+        lxml_xml = _strip_build_date(lxml_path.read_text(encoding="utf-8"))
+        assert lxml_xml == _strip_build_date(fg_path.read_text(encoding="utf-8"))
+        # Newest episode first
+        assert lxml_xml.index("Episode 3") < lxml_xml.index("Episode 1")
+
+
 def test_validate_feed_valid():
     config = FeedConfig(
         title="Test Podcast",
@@ -81,3 +110,113 @@ def test_validate_feed_missing_file():
     result = validate_feed(Path("/nonexistent/feed.xml"))
     assert not result.is_valid
     assert "not found" in result.errors[0]
+
+
+def test_load_episodes_from_dir(tmp_path):
+    for num in (1, 2):
+        ep_dir = tmp_path / f"ep{num}"
+        ep_dir.mkdir()
+        meta = _make_episode(num).metadata
+        (ep_dir / f"ep{num}_metadata.json").write_text(meta.model_dump_json(), encoding="utf-8")
+
+    state = PipelineState(episode_id="ep1")
+    state.set_completed("host_audio", {
+        "audio_url": "https://cdn.example.com/episodes/ep1.mp3",
+        "audio_size_bytes": 123,
+        "audio_duration_seconds": 60.0,
+    })
+    save_state(state, tmp_path)
+    (tmp_path / "not_an_episode").mkdir()
+
+    episodes = {ep.input_file: ep for ep in load_episodes_from_dir(tmp_path)}
+    assert sorted(episodes) == ["ep1", "ep2"]
+    assert episodes["ep1"].metadata.title == "Episode 1: Test Title"
+    assert episodes["ep1"].audio_url == "https://cdn.example.com/episodes/ep1.mp3"
+    assert episodes["ep1"].audio_size_bytes == 123
+    assert episodes["ep2"].audio_url is None
+
+
+def test_validate_feed_reports_item_errors(tmp_path):
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_text(
+        '<rss version="2.0"><channel><title>T</title><description>D</description>'
+        "<link>https://example.com</link>"
+        "<item><title>One</title><description>d</description>"
+        '<enclosure url="https://cdn.example.com/1.mp3" length="10" type="audio/mpeg"/>'
+        "<guid>1</guid></item>"
+        "<item><title>Two</title></item>"
+        "</channel></rss>",
+        encoding="utf-8",
+    )
+    result = validate_feed(feed_path)
+    assert "Missing required element: itunes:author" in result.errors
+    assert "Missing required element: Episode 2: description" in result.errors
+    assert "Episode 2: Missing <enclosure> element" in result.errors
+    assert not any(e.startswith("Episode 1") for e in result.errors)
+    # Channel-level problems are reported before per-episode ones
+    assert result.errors.index("Missing required element: itunes:author") < result.errors.index(
+        "Episode 2: Missing <enclosure> element"
+    )
+
+
+def test_validate_feed_parse_error(tmp_path):
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_text('<rss version="2.0"><channel><item></channel>', encoding="utf-8")
+    result = validate_feed(feed_path)
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("XML parse error")
+
+
+def test_validate_feed_does_not_expand_entities(tmp_path, mocker):
+    from podflow.feed import validator
+
+    secret = tmp_path / "secret.txt"
+    secret.write_text("SECRET", encoding="utf-8")
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_text(
+        f'<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY x SYSTEM "{secret.as_uri()}">'
+        '<!ENTITY a "aaaaaaaa">]>'
+        '<rss version="2.0"><channel><item><title>&x;&a;</title></item></channel></rss>',
+        encoding="utf-8",
+    )
+    titles = []
+    mocker.patch.object(
+        validator, "_validate_item",
+        side_effect=lambda elem, *args: titles.append("".join(elem.find("title").itertext())),
+    )
+
+    validate_feed(feed_path)
+    # Entity references are left as-is rather than expanded or fetched
+    assert titles == ["&x;&a;"]
+
+
+def test_upload_audio_local(tmp_path):
+    audio = tmp_path / "ep1.mp3"
+    audio.write_bytes(b"\xff\xfb" * 1000)
+    config = HostingConfig(
+        local_dir=str(tmp_path / "hosted"),
+        local_public_url_base="https://cdn.example.com/",
+    )
+
+    result = upload_audio(audio, config)
+
+    hosted = tmp_path / "hosted" / "ep1.mp3"
+    assert result.public_url == "https://cdn.example.com/ep1.mp3"
+    assert result.size_bytes == 2000
+    assert hosted.read_bytes() == audio.read_bytes()
+    assert hosted.stat().st_mtime_ns == audio.stat().st_mtime_ns
+
+
+def test_upload_audio_s3_skips_unchanged_object(tmp_path, mocker):
+    from podflow.feed import hosting
+
+    audio = tmp_path / "ep1.mp3"
+    audio.write_bytes(b"\xff\xfb" * 1000)
+    s3 = mocker.Mock()
+    s3.head_object.return_value = {"Metadata": {"sha256": hosting._file_sha256(audio)}}
+    mocker.patch.object(hosting, "_s3_client", return_value=s3)
+
+    result = upload_audio(audio, HostingConfig(method="s3", s3_bucket="pods"))
+
+    assert result.public_url == "https://pods.s3.amazonaws.com/episodes/ep1.mp3"
+    s3.upload_file.assert_not_called()
@@ -4,8 +4,10 @@ import json
 
 import pytest
 
-from podflow.metadata.generator import _parse_response
-from podflow.metadata.models import EpisodeMetadata
+from podflow.config import MetadataConfig
+from podflow.metadata import generator
+from podflow.metadata.generator import _parse_response, generate_metadata, load_transcript
+from podflow.metadata.models import EpisodeMetadata, Transcript, TranscriptSegment
 from podflow.metadata.prompts import build_metadata_prompt
 
 
@@ -50,3 +52,125 @@ def test_parse_response_with_code_fences():
 def test_parse_response_invalid_json():
     with pytest.raises(json.JSONDecodeError):
         _parse_response("not json at all")
+
+
+def test_load_transcript(tmp_path):
+    transcript = Transcript(
+        segments=[TranscriptSegment(start=0.0, end=2.5, text="Héllo")],
+        language="fr",
+        full_text="Héllo",
+    )
+    path = tmp_path / "ep_transcript.json"
+    path.write_text(transcript.model_dump_json(indent=2), encoding="utf-8")
+
+    assert load_transcript(path) == transcript
+
+
+def test_generate_metadata_uses_cache(tmp_path, monkeypatch, mocker):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    call = mocker.patch.object(
+        generator, "_call_anthropic", return_value='{"title": "Cached", "tags": ["a"]}',
+    )
+    transcript = Transcript(
+        segments=[TranscriptSegment(start=0.0, end=1.0, text="Hi")], full_text="Hi",
+    )
+
+    first = generate_metadata(transcript, MetadataConfig())
+    second = generate_metadata(transcript, MetadataConfig())
+    assert first == second
+    assert second.title == "Cached"
+    assert call.call_count == 1
+
+    generate_metadata(transcript, MetadataConfig(max_tags=3))
+    generate_metadata(transcript, MetadataConfig(cache_enabled=False))
+    assert call.call_count == 3
+
+
+def test_truncate_transcript_to_token_budget():
+    config = MetadataConfig(max_input_tokens=10)
+    assert generator._truncate_transcript("short", config) == "short"
+    assert generator._truncate_transcript("x" * 100, config) == "x" * 40
+
+
+def test_generate_metadata_batch(tmp_path, monkeypatch, mocker):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    call = mocker.patch.object(
+        generator, "_call_anthropic",
+        return_value='{"episodes": [{"title": "One"}, {"title": "Two"}, {"title": "Three"}]}',
+    )
+    transcripts = [
+        Transcript(segments=[TranscriptSegment(start=0.0, end=1.0, text=t)], full_text=t)
+        for t in ("a", "b", "c")
+    ]
+
+    config = MetadataConfig(max_output_tokens=16384)
+    results = generator.generate_metadata_batch(transcripts, config)
+    assert [m.title for m in results] == ["One", "Two", "Three"]
+    assert call.call_count == 1
+
+    # Each episode is cached individually
+    assert generate_metadata(transcripts[1], MetadataConfig()).title == "Two"
+    assert call.call_count == 1
+
+
+@pytest.mark.parametrize("episodes", ['["a", "b"]', '{"a": {}, "b": {}}'])
+def test_generate_metadata_batch_falls_back_on_malformed_episodes(mocker, episodes):
+    call = mocker.patch.object(
+        generator, "_call_anthropic",
+        side_effect=[f'{{"episodes": {episodes}}}', '{"title": "A"}', '{"title": "B"}'],
+    )
+    transcripts = [Transcript(full_text="a"), Transcript(full_text="b")]
+
+    results = generator.generate_metadata_batch(transcripts, MetadataConfig(cache_enabled=False))
+    assert [m.title for m in results] == ["A", "B"]
+    assert call.call_count == 3
+
+
+def test_generate_metadata_batch_falls_back_on_mismatch(mocker):
+    call = mocker.patch.object(
+        generator, "_call_anthropic",
+        side_effect=['{"episodes": [{"title": "Only one"}]}', '{"title": "A"}', '{"title": "B"}'],
+    )
+    transcripts = [Transcript(full_text="a"), Transcript(full_text="b")]
+
+    results = generator.generate_metadata_batch(transcripts, MetadataConfig(cache_enabled=False))
+    assert [m.title for m in results] == ["A", "B"]
+    assert call.call_count == 3
+
+
+def test_generate_metadata_batch_falls_back_on_api_error(mocker):
+    import anthropic
+
+    error = anthropic.APIConnectionError(request=None)
+    call = mocker.patch.object(
+        generator, "_call_anthropic", side_effect=[error, '{"title": "A"}', '{"title": "B"}'],
+    )
+    transcripts = [Transcript(full_text="a"), Transcript(full_text="b")]
+
+    results = generator.generate_metadata_batch(transcripts, MetadataConfig(cache_enabled=False))
+    assert [m.title for m in results] == ["A", "B"]
+    assert call.call_count == 3
+
+
+def test_generate_metadata_batch_respects_output_cap(mocker):
+    call = mocker.patch.object(
+        generator, "_call_anthropic",
+        return_value='{"episodes": [{"title": "X"}, {"title": "Y"}]}',
+    )
+    transcripts = [Transcript(full_text=t) for t in "abcd"]
+
+    config = MetadataConfig(cache_enabled=False, max_output_tokens=8192)
+    generator.generate_metadata_batch(transcripts, config, max_batch_size=4)
+    assert call.call_count == 2
+    assert all(c.args[2] <= config.max_output_tokens for c in call.call_args_list)
+
+
+def test_generate_metadata_survives_unusable_cache(tmp_path, monkeypatch, mocker):
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(not_a_dir))
+    call = mocker.patch.object(generator, "_call_anthropic", return_value='{"title": "Fresh"}')
+
+    metadata = generate_metadata(Transcript(full_text="Hi"), MetadataConfig())
+    assert metadata.title == "Fresh"
+    assert call.call_count == 1
@@ -3,12 +3,17 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
+from podflow import state as state_module
 from podflow.state import (
     PIPELINE_STAGES,
     PipelineState,
     StageStatus,
+    flush_state_writes,
     load_state,
     save_state,
+    state_file_path,
 )
 
 
@@ -68,3 +73,43 @@ def test_save_and_load_state():
         assert loaded.is_completed("process_audio")
         assert loaded.get_stage("transcribe").status == StageStatus.FAILED
         assert loaded.get_stage("transcribe").error == "timeout"
+
+
+def test_save_state_skips_unchanged(tmp_path):
+    state = PipelineState(episode_id="ep123")
+    save_state(state, tmp_path)
+    flush_state_writes()
+    path = tmp_path / ".podflow_state_ep123.json"
+    path.unlink()
+
+    save_state(state, tmp_path)
+    assert not path.exists()
+
+    state.set_running("process_audio")
+    save_state(state, tmp_path)
+    assert load_state(tmp_path, "ep123").get_stage("process_audio").status == StageStatus.RUNNING
+
+
+def test_state_write_errors_stay_with_their_file(tmp_path, mocker):
+    real_write = state_module.atomic_write_bytes
+
+    def write(path, data):
+        if path.name.endswith("bad.json"):
+            raise TypeError("boom")
+        real_write(path, data)
+
+    mocker.patch.object(state_module, "atomic_write_bytes", side_effect=write)
+    save_state(PipelineState(episode_id="bad"), tmp_path)
+    save_state(PipelineState(episode_id="good"), tmp_path)
+
+    # One episode's failure is not raised from another's flush
+    flush_state_writes(state_file_path(tmp_path, "good"))
+    # Waiting without raising leaves the error for its own file's flush
+    flush_state_writes(raise_errors=False)
+    with pytest.raises(TypeError):
+        flush_state_writes(state_file_path(tmp_path, "bad"))
+
+    # The writer survives and keeps writing
+    save_state(PipelineState(episode_id="later"), tmp_path)
+    flush_state_writes()
+    assert state_file_path(tmp_path, "later").exists()
@@ -0,0 +1,109 @@
+"""Tests for transcription backends (with mocked API calls)."""
+
+import pytest
+from openai.types.audio import TranscriptionVerbose
+
+from podflow.config import TranscriptionConfig
+from podflow.transcription import whisper_api
+from podflow.transcription.whisper_api import WhisperAPITranscriber
+from podflow.transcription.whisper_local import WhisperLocalTranscriber
+
+_SEGMENT = {
+    "id": 0, "seek": 0, "start": 0.0, "end": 2.0, "text": " Hello there",
+    "tokens": [], "temperature": 0.0, "avg_logprob": 0.0,
+    "compression_ratio": 1.0, "no_speech_prob": 0.0,
+}
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_whisper_api_segments(tmp_path, mocker, typed):
+    payload = {"text": " Hello there ", "language": "english", "duration": 2.0, "segments": [_SEGMENT]}
+    response = TranscriptionVerbose.model_validate(payload) if typed else mocker.Mock(**payload)
+    client = mocker.patch.object(whisper_api, "_shared_client").return_value
+    client.audio.transcriptions.create.return_value = response
+    mocker.patch.object(whisper_api, "get_api_key", return_value="key")
+    audio = tmp_path / "ep.mp3"
+    audio.write_bytes(b"\0")
+
+    transcript = WhisperAPITranscriber(TranscriptionConfig(cache_enabled=False)).transcribe(audio)
+    assert transcript.full_text == "Hello there"
+    assert transcript.language == "english"
+    assert [(s.start, s.end, s.text) for s in transcript.segments] == [(0.0, 2.0, "Hello there")]
+
+
+def test_whisper_api_uses_transcript_cache(tmp_path, mocker):
+    payload = {"text": "Hi", "language": "en", "duration": 1.0, "segments": [_SEGMENT]}
+    client = mocker.patch.object(whisper_api, "_shared_client").return_value
+    client.audio.transcriptions.create.return_value = TranscriptionVerbose.model_validate(payload)
+    mocker.patch.object(whisper_api, "get_api_key", return_value="key")
+    audio = tmp_path / "ep.mp3"
+    audio.write_bytes(b"\0")
+    config = TranscriptionConfig(cache_dir=str(tmp_path / "cache"))
+
+    first = WhisperAPITranscriber(config).transcribe(audio)
+    assert WhisperAPITranscriber(config).transcribe(audio) == first
+    assert client.audio.transcriptions.create.call_count == 1
+
+    # Different settings or different audio miss the cache
+    WhisperAPITranscriber(config.model_copy(update={"prompt": "Podflow"})).transcribe(audio)
+    audio.write_bytes(b"\1")
+    WhisperAPITranscriber(config).transcribe(audio)
+    assert client.audio.transcriptions.create.call_count == 3
+
+
+def test_whisper_local_batch_without_vad_decodes_per_file(tmp_path, mocker):
+    transcriber = WhisperLocalTranscriber(TranscriptionConfig(vad=False, cache_enabled=False))
+    model = mocker.Mock()
+    model.transcribe.return_value = ([], mocker.Mock(language="en"))
+    mocker.patch.object(transcriber, "_load_model", return_value=model)
+    load_batched = mocker.patch.object(transcriber, "_load_batched")
+    paths = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+
+    transcripts = transcriber.transcribe_batch(paths)
+    assert len(transcripts) == 2
+    assert model.transcribe.call_count == 2
+    assert model.transcribe.call_args.kwargs["vad_filter"] is False
+    load_batched.assert_not_called()
+
+
+def test_whisper_api_survives_unusable_cache(tmp_path, mocker):
+    payload = {"text": "Hi", "language": "en", "duration": 1.0, "segments": [_SEGMENT]}
+    client = mocker.patch.object(whisper_api, "_shared_client").return_value
+    client.audio.transcriptions.create.return_value = TranscriptionVerbose.model_validate(payload)
+    mocker.patch.object(whisper_api, "get_api_key", return_value="key")
+    audio = tmp_path / "ep.mp3"
+    audio.write_bytes(b"\0")
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("")
+
+    config = TranscriptionConfig(cache_dir=str(not_a_dir / "transcripts"))
+    assert WhisperAPITranscriber(config).transcribe(audio).full_text == "Hi"
+
+
+def test_whisper_local_concurrent_loads_share_one_model(mocker):
+    import threading
+    import time
+
+    from podflow.transcription import whisper_local
+
+    whisper_local._shared_model.cache_clear()
+    mocker.patch.object(whisper_local, "_resolve_device", return_value=("cpu", "int8"))
+    loads = []
+
+    def slow_model(*args, **kwargs):
+        loads.append(args)
+        time.sleep(0.05)
+        return object()
+
+    mocker.patch.dict("sys.modules", {"faster_whisper": mocker.Mock(WhisperModel=slow_model)})
+    config = TranscriptionConfig(backend="whisper_local")
+    threads = [
+        threading.Thread(target=WhisperLocalTranscriber(config)._load_model) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loads) == 1
+    whisper_local._shared_model.cache_clear()
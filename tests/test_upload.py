@@ -0,0 +1,79 @@
+"""Tests for YouTube upload helpers."""
+
+import pytest
+
+from podflow.upload import youtube
+
+
+def test_resumable_upload_retries_transient_errors(mocker):
+    sleep = mocker.patch.object(youtube.time, "sleep")
+    request = mocker.Mock()
+    request.next_chunk.side_effect = (
+        [ConnectionError()] * youtube.MAX_RETRIES
+        + [(None, None)]
+        + [TimeoutError()] * youtube.MAX_RETRIES
+        + [(None, {"id": "abc123"})]
+    )
+
+    # The budget resets after a successful chunk
+    assert youtube._resumable_upload(request) == "abc123"
+    assert sleep.call_count == 2 * youtube.MAX_RETRIES
+    assert all(youtube.BACKOFF_BASE <= c.args[0] <= youtube.BACKOFF_CAP for c in sleep.call_args_list)
+
+
+def test_resumable_upload_gives_up(mocker):
+    mocker.patch.object(youtube.time, "sleep")
+    request = mocker.Mock()
+    request.next_chunk.side_effect = ConnectionError()
+
+    with pytest.raises(RuntimeError, match="ConnectionError"):
+        youtube._resumable_upload(request)
+    assert request.next_chunk.call_count == youtube.MAX_RETRIES + 1
+
+
+def test_fit_tags_respects_byte_budget():
+    tags = ["é" * 60, "two words", "x" * 400, "short"]
+
+    # 120 + 12 + 400 would exceed 500; later tags are dropped with it
+    assert youtube._fit_tags(tags) == ["é" * 60, "two words"]
+    assert len(youtube._fit_tags(["t"] * 30)) == youtube.MAX_TAGS
+
+
+def test_youtube_client_reused_per_credentials(mocker):
+    build = mocker.patch.object(youtube, "build")
+    youtube._youtube_client.cache_clear()
+    creds, other = object(), object()
+
+    assert youtube._youtube_client(creds, 1) is youtube._youtube_client(creds, 1)
+    youtube._youtube_client(creds, 2)
+    youtube._youtube_client(other, 1)
+    assert build.call_count == 3
+    build.assert_called_with("youtube", "v3", credentials=other, cache_discovery=False)
+    youtube._youtube_client.cache_clear()
+
+
+def test_resumable_upload_throttles_progress_log(mocker):
+    mocker.patch.object(youtube.log, "isEnabledFor", return_value=True)
+    info = mocker.patch.object(youtube.log, "info")
+    request = mocker.Mock()
+    statuses = [mocker.Mock(**{"progress.return_value": p / 100}) for p in range(1, 100)]
+    request.next_chunk.side_effect = [(s, None) for s in statuses] + [(None, {"id": "abc123"})]
+
+    assert youtube._resumable_upload(request) == "abc123"
+    assert [c.args[1] for c in info.call_args_list] == list(range(1, 100, youtube.PROGRESS_LOG_STEP))
+
+
+def test_upload_many_keeps_order_and_errors(mocker, tmp_path):
+    mocker.patch.object(youtube, "get_authenticated_credentials")
+
+    def fake_upload(video_path, metadata, config, privacy=None):
+        if video_path.name == "bad.mp4":
+            raise RuntimeError("boom")
+        return video_path.stem
+
+    mocker.patch.object(youtube, "upload_to_youtube", side_effect=fake_upload)
+    jobs = [(tmp_path / f"{name}.mp4", None) for name in ("a", "bad", "c")]
+
+    results = youtube.upload_many(jobs, config=mocker.Mock())
+    assert results[0] == "a" and results[2] == "c"
+    assert isinstance(results[1], RuntimeError)
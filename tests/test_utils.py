@@ -1,8 +1,17 @@
 """Tests for utility modules."""
 
+import sys
 from pathlib import Path
 
-from podflow.utils.paths import episode_id_from_file, sanitize_filename
+import pytest
+
+from podflow.utils.paths import (
+    episode_id_from_file,
+    episode_path,
+    output_metadata_path,
+    sanitize_filename,
+    sanitize_filenames,
+)
 from podflow.utils.time_format import (
     format_duration_human,
     hms_to_seconds,
@@ -16,16 +25,23 @@ class TestTimeFormat:
         assert seconds_to_hms(0) == "00:00:00"
         assert seconds_to_hms(65) == "00:01:05"
         assert seconds_to_hms(3661) == "01:01:01"
+        assert seconds_to_hms(360000) == "100:00:00"
+        assert seconds_to_hms(-1) == "-1:59:59"
 
     def test_seconds_to_ms(self):
         assert seconds_to_ms(0) == "00:00"
         assert seconds_to_ms(65) == "01:05"
         assert seconds_to_ms(600) == "10:00"
+        assert seconds_to_ms(6000) == "100:00"
+        assert seconds_to_ms(-1) == "-1:59"
 
     def test_hms_to_seconds(self):
         assert hms_to_seconds("01:01:01") == 3661.0
         assert hms_to_seconds("01:05") == 65.0
         assert hms_to_seconds("30") == 30.0
+        assert hms_to_seconds("00:00:01.5") == 1.5
+        with pytest.raises(ValueError):
+            hms_to_seconds("1:02:03:04")
 
     def test_format_duration_human(self):
         assert format_duration_human(30) == "30s"
@@ -38,6 +54,14 @@ class TestPaths:
         assert sanitize_filename("hello world") == "hello_world"
         assert sanitize_filename('a<b>c:d"e') == "a_b_c_d_e"
         assert sanitize_filename("...leading") == "leading"
+        # Unsafe characters map one for one; whitespace runs collapse
+        assert sanitize_filename("a: b\t\n c??") == "a__b_c"
+
+    def test_sanitize_filenames_matches_single(self):
+        names = ["hello world", 'a<b>c:d"e', "...leading", "", "nul\x00inside", " x / y "]
+        assert sanitize_filenames(names) == [sanitize_filename(n) for n in names]
+        assert sanitize_filenames(names[:3]) == ["hello_world", "a_b_c_d_e", "leading"]
+        assert sanitize_filenames([]) == []
 
     def test_episode_id_from_file(self):
         eid = episode_id_from_file(Path("recording_2024.wav"))
@@ -45,8 +69,27 @@ class TestPaths:
         # Stable: same input gives same output
         eid2 = episode_id_from_file(Path("recording_2024.wav"))
         assert eid == eid2
+        assert episode_id_from_file("recording_2024.wav") == eid
 
     def test_episode_id_different_files(self):
         eid1 = episode_id_from_file(Path("/a/recording.wav"))
         eid2 = episode_id_from_file(Path("/b/recording.wav"))
         assert eid1 != eid2
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX absolute path")
+    def test_episode_id_is_pinned(self):
+        # IDs name output dirs and state files; changing the hash orphans them
+        assert episode_id_from_file(Path("/a/recording.wav")) == "recording_250e03e5"
+        assert episode_id_from_file("/a/recording.wav") == "recording_250e03e5"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX byte filenames")
+    def test_episode_id_undecodable_filename(self):
+        # os.listdir decodes non-UTF-8 bytes to lone surrogates
+        eid = episode_id_from_file(Path("/a/ep\udcff.wav"))
+        assert eid.startswith("ep\udcff_")
+
+    def test_episode_path(self):
+        d = Path("/out/ep")
+        assert episode_path(d, "ep", "audio") == d / "ep.mp3"
+        assert episode_path(d, "ep", "transcript") == d / "ep_transcript.json"
+        assert output_metadata_path(d, "ep") == episode_path(d, "ep", "metadata")